@@ -69,6 +69,12 @@ for i in range(52):
     else:
         SMPL_OFFSETS[i] = J_ABSOLUTE[i] - J_ABSOLUTE[parent_idx]
 
+# Joint each bone points toward (first child, Pelvis -> Spine1), -1 for leaf bones
+CHILD_IDX_FOR_BONE: NDArray[np.int32] = np.full(52, -1, dtype=np.int32)
+for j in range(51, 0, -1):
+    CHILD_IDX_FOR_BONE[SMPL_H_PARENTS[j]] = j
+CHILD_IDX_FOR_BONE[0] = 3
+
 
 def axis_angle_to_rotation_matrix(axis_angle: NDArray[np.float64]) -> NDArray[np.float64]:
     """Convert axis-angle to rotation matrix"""
@@ -87,26 +93,23 @@ def axis_angle_to_rotation_matrix(axis_angle: NDArray[np.float64]) -> NDArray[np
 
 
 def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
-    """Compute forward kinematics"""
+    """Compute forward kinematics (rotation + translation per joint, no 4x4 matrices)"""
     num_joints: int = len(SMPL_H_PARENTS)
     joint_positions: NDArray[np.float64] = np.zeros((num_joints, 3))
     pose_params: NDArray[np.float64] = poses.reshape(-1, 3)
-    global_transforms: List[NDArray[np.float64]] = [np.eye(4) for _ in range(num_joints)]
+    global_rotations: NDArray[np.float64] = np.empty((num_joints, 3, 3))
     
     for i in range(num_joints):
         rot_mat = axis_angle_to_rotation_matrix(pose_params[i]) if i < len(pose_params) else np.eye(3)
-        local_transform: NDArray[np.float64] = np.eye(4)
-        local_transform[:3, :3] = rot_mat
-        local_transform[:3, 3] = SMPL_OFFSETS[i]
         
         parent_idx: int = int(SMPL_H_PARENTS[i])
         if parent_idx == -1:
-            global_transforms[i] = local_transform
-            global_transforms[i][:3, 3] += trans
+            global_rotations[i] = rot_mat
+            joint_positions[i] = SMPL_OFFSETS[i] + trans
         else:
-            global_transforms[i] = global_transforms[parent_idx] @ local_transform
-        
-        joint_positions[i] = global_transforms[i][:3, 3]
+            parent_rotation = global_rotations[parent_idx]
+            global_rotations[i] = parent_rotation @ rot_mat
+            joint_positions[i] = joint_positions[parent_idx] + parent_rotation @ SMPL_OFFSETS[i]
     
     return joint_positions
 
@@ -157,28 +160,88 @@ def create_tpose_armature(name: str = "SMPLH_Armature") -> bpy.types.Object:
     return armature_obj
 
 
-def compute_bone_rotation(bone_head: Vector, bone_tail: Vector, target_pos: Vector) -> Quaternion:
+def axis_angle_to_rotation_matrices_batch(axis_angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Convert (..., 3) axis-angle vectors to (..., 3, 3) rotation matrices"""
+    angles: NDArray[np.float64] = np.linalg.norm(axis_angles, axis=-1, keepdims=True)
+    axes: NDArray[np.float64] = axis_angles / np.where(angles < 1e-6, 1.0, angles)
+    K: NDArray[np.float64] = np.zeros(axis_angles.shape[:-1] + (3, 3), dtype=axis_angles.dtype)
+    K[..., 0, 1] = -axes[..., 2]
+    K[..., 0, 2] = axes[..., 1]
+    K[..., 1, 0] = axes[..., 2]
+    K[..., 1, 2] = -axes[..., 0]
+    K[..., 2, 0] = -axes[..., 1]
+    K[..., 2, 1] = axes[..., 0]
+    sin_angles = np.sin(angles)[..., np.newaxis]
+    cos_angles = np.cos(angles)[..., np.newaxis]
+    return np.eye(3, dtype=axis_angles.dtype) + sin_angles * K + (1 - cos_angles) * (K @ K)
+
+
+def forward_kinematics_batch(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Compute forward kinematics for all frames at once, returning (num_frames, 52, 3)"""
+    num_frames: int = len(poses)
+    num_joints: int = len(SMPL_H_PARENTS)
+    pose_params: NDArray[np.float64] = np.zeros((num_frames, num_joints, 3), dtype=poses.dtype)
+    provided = poses.reshape(num_frames, -1, 3)[:, :num_joints]
+    pose_params[:, :provided.shape[1]] = provided
+    
+    local_rotations = axis_angle_to_rotation_matrices_batch(pose_params)
+    global_rotations = np.empty_like(local_rotations)
+    joint_positions: NDArray[np.float64] = np.empty((num_frames, num_joints, 3), dtype=local_rotations.dtype)
+    
+    for i in range(num_joints):
+        parent_idx: int = int(SMPL_H_PARENTS[i])
+        if parent_idx == -1:
+            global_rotations[:, i] = local_rotations[:, i]
+            joint_positions[:, i] = SMPL_OFFSETS[i] + trans
+        else:
+            global_rotations[:, i] = np.einsum('fjk,fkl->fjl', global_rotations[:, parent_idx], local_rotations[:, i])
+            joint_positions[:, i] = (
+                np.einsum('fjk,k->fj', global_rotations[:, parent_idx], SMPL_OFFSETS[i])
+                + joint_positions[:, parent_idx]
+            )
+    
+    return joint_positions
+
+
+def compute_bone_rotations(
+    bone_heads: NDArray[np.float64],
+    rest_dirs: NDArray[np.float64],
+    target_positions: NDArray[np.float64]
+) -> NDArray[np.float64]:
     """
-    Compute rotation needed to make bone point from head toward target
+    Compute rotations needed to make bones point from head toward target, for all frames at once
     
     Args:
-        bone_head: Bone head position in rest pose
-        bone_tail: Bone tail position in rest pose  
-        target_pos: Target position to point toward
+        bone_heads: Bone head positions in rest pose (num_bones, 3)
+        rest_dirs: Unit rest directions, head toward tail (num_bones, 3)
+        target_positions: Target positions to point toward (num_frames, num_bones, 3)
         
     Returns:
-        Quaternion rotation
+        Shortest-arc quaternions (w, x, y, z) rotating rest to target (num_frames, num_bones, 4)
     """
-    # Rest direction (bone's default orientation)
-    rest_dir = (bone_tail - bone_head).normalized()
-    
     # Target direction
-    target_dir = (target_pos - bone_head).normalized()
+    target_dirs = target_positions - bone_heads
+    target_dirs /= np.linalg.norm(target_dirs, axis=-1, keepdims=True)
+    
+    # Shortest-arc quaternion from rest to target: (1 + dot, cross), normalized - no trig needed
+    w = 1.0 + np.einsum('fij,ij->fi', target_dirs, rest_dirs)
+    xyz = np.cross(rest_dirs, target_dirs)
+    
+    # Anti-parallel directions leave (w, xyz) at zero: rotate 180 degrees about any axis perpendicular to rest
+    anti_parallel = w < 1e-6
+    if anti_parallel.any():
+        perpendicular_axes = np.cross(rest_dirs, [0.0, 0.0, 1.0])
+        parallel_to_up = np.linalg.norm(perpendicular_axes, axis=-1) < 1e-6
+        perpendicular_axes[parallel_to_up] = np.cross(rest_dirs[parallel_to_up], [1.0, 0.0, 0.0])
+        perpendicular_axes /= np.linalg.norm(perpendicular_axes, axis=-1, keepdims=True)
+        
+        w = np.where(anti_parallel, 0.0, w)
+        xyz = np.where(anti_parallel[..., np.newaxis], perpendicular_axes, xyz)
     
-    # Compute rotation from rest to target
-    rotation = rest_dir.rotation_difference(target_dir)
+    rotations = np.concatenate([w[..., np.newaxis], xyz], axis=-1)
+    rotations /= np.linalg.norm(rotations, axis=-1, keepdims=True)
     
-    return rotation
+    return rotations
 
 
 def retarget_animation(
@@ -201,38 +264,44 @@ def retarget_animation(
     zero_trans = np.zeros(3, dtype=np.float64)
     tpose_joints = forward_kinematics(zero_poses, zero_trans)
     
-    # Store bone rest info
-    bone_info = []
-    for i in range(52):
-        children = [j for j in range(52) if SMPL_H_PARENTS[j] == i]
-        child_idx = children[0] if children else None
-        if i == 0 and children:
-            child_idx = 3  # Pelvis points to Spine1
-        
-        bone_info.append({
-            'head': Vector(tpose_joints[i]),
-            'tail': Vector(tpose_joints[child_idx]) if child_idx is not None else None,
-            'child_idx': child_idx
-        })
+    # Store bone rest info as parallel arrays
+    bone_heads = tpose_joints.copy()
+    has_child = CHILD_IDX_FOR_BONE >= 0
+    bone_tails = np.where(has_child[:, np.newaxis], tpose_joints[CHILD_IDX_FOR_BONE], bone_heads)
+    
+    # Rest directions are constant for the whole clip, so normalize them once here
+    rest_dirs = bone_tails[has_child] - bone_heads[has_child]
+    rest_dirs /= np.linalg.norm(rest_dirs, axis=1, keepdims=True)
+    
+    # Compute joint positions and bone rotations for every frame before touching Blender
+    all_frame_joints = forward_kinematics_batch(poses, trans)
+    
+    bone_rotations = np.zeros((num_frames, 52, 4))
+    bone_rotations[..., 0] = 1.0
+    bone_rotations[:, has_child] = compute_bone_rotations(
+        bone_heads[has_child],
+        rest_dirs,
+        all_frame_joints[:, CHILD_IDX_FOR_BONE[has_child]]
+    )
     
     # Animate
     bpy.context.view_layer.objects.active = armature_obj
     bpy.ops.object.mode_set(mode='POSE')
     
+    # Resolve pose bones once rather than by name 52 times per frame
+    pose_bones = [armature_obj.pose.bones[name] for name in JOINT_NAMES]
+    
     print(f"Retargeting {num_frames} frames...")
     
     for frame_idx in range(num_frames):
         if frame_idx % 100 == 0:
             print(f"  Frame {frame_idx}/{num_frames}")
         
-        bpy.context.scene.frame_set(frame_idx)
-        
-        # Compute FK positions for this frame
-        frame_joints = forward_kinematics(poses[frame_idx], trans[frame_idx])
+        # No frame_set here: keyframe_insert(frame=...) already encodes the time
+        frame_joints = all_frame_joints[frame_idx]
         
         # Apply rotations to each bone
-        for i in range(52):
-            pose_bone = armature_obj.pose.bones[JOINT_NAMES[i]]
+        for i, pose_bone in enumerate(pose_bones):
             
             # Root gets translation
             if i == 0:
@@ -241,14 +310,10 @@ def retarget_animation(
             else:
                 pose_bone.location = Vector((0, 0, 0))
             
-            # Compute rotation
-            info = bone_info[i]
-            if info['child_idx'] is not None:
-                target_pos = Vector(frame_joints[info['child_idx']])
-                rotation = compute_bone_rotation(info['head'], info['tail'], target_pos)
-                
+            # Apply precomputed rotation
+            if has_child[i]:
                 pose_bone.rotation_mode = 'QUATERNION'
-                pose_bone.rotation_quaternion = rotation
+                pose_bone.rotation_quaternion = Quaternion(bone_rotations[frame_idx, i])
                 pose_bone.keyframe_insert(data_path="rotation_quaternion", frame=frame_idx)
     
     bpy.ops.object.mode_set(mode='OBJECT')
@@ -68,64 +68,69 @@ for i in range(52):
         SMPL_OFFSETS[i] = J_ABSOLUTE[i] - J_ABSOLUTE[parent_idx]
 
 
-def axis_angle_to_rotation_matrix(axis_angle: NDArray[np.float64]) -> NDArray[np.float64]:
-    """Convert axis-angle to rotation matrix using Rodrigues' formula"""
-    angle: float = np.linalg.norm(axis_angle)
-    if angle < 1e-6:
-        return np.eye(3)
-    
-    # Normalize axis
-    axis: NDArray[np.float64] = axis_angle / angle
+def axis_angle_to_rotation_matrices(axis_angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Convert (N, 3) axis-angle vectors to (N, 3, 3) rotation matrices using Rodrigues' formula"""
+    angles: NDArray[np.float64] = np.linalg.norm(axis_angles, axis=1, keepdims=True)
+    
+    # Normalize axes (zero rotations keep a zero axis and end up as identity)
+    axes: NDArray[np.float64] = axis_angles / np.where(angles < 1e-6, 1.0, angles)
+    
+    # Skew-symmetric cross-product matrices, one per rotation
+    K: NDArray[np.float64] = np.zeros((len(axis_angles), 3, 3))
+    K[:, 0, 1] = -axes[:, 2]
+    K[:, 0, 2] = axes[:, 1]
+    K[:, 1, 0] = axes[:, 2]
+    K[:, 1, 2] = -axes[:, 0]
+    K[:, 2, 0] = -axes[:, 1]
+    K[:, 2, 1] = axes[:, 0]
     
     # Rodrigues' rotation formula
-    K: NDArray[np.float64] = np.array([
-        [0, -axis[2], axis[1]],
-        [axis[2], 0, -axis[0]],
-        [-axis[1], axis[0], 0]
-    ])
-    
-    R: NDArray[np.float64] = np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * (K @ K)
+    sin_angles: NDArray[np.float64] = np.sin(angles)[:, :, np.newaxis]
+    cos_angles: NDArray[np.float64] = np.cos(angles)[:, :, np.newaxis]
+    R: NDArray[np.float64] = np.eye(3) + sin_angles * K + (1 - cos_angles) * (K @ K)
     return R
 
-# converts a single frame of NPZ animation data to global transformations (4x4) for each joint
-def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
-    """EXACT SAME FUNCTION AS MATPLOTLIB SCRIPT"""
+# converts a whole NPZ animation to global joint positions
+def forward_kinematics_batch(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Forward kinematics for all frames at once: (T, D) poses + (T, 3) trans -> (T, 52, 3).
+    
+    The joint chain is still walked in order, but every step handles all frames
+    in one NumPy call, since frames are independent of each other.
+    """
+    num_frames: int = len(poses)
     num_joints: int = len(SMPL_H_PARENTS)
-    joint_positions: NDArray[np.float64] = np.zeros((num_joints, 3))
+    joint_positions: NDArray[np.float64] = np.zeros((num_frames, num_joints, 3))
     
-    # Reshape poses: (156,) -> (52, 3) for 52 joints
-    # Axis-angle parameters for each joint - directly from the npz file
-    pose_params: NDArray[np.float64] = poses.reshape(-1, 3)
+    # Reshape poses: (T, D) -> (T, 52, 3); joints missing from the data keep identity
+    pose_params: NDArray[np.float64] = np.zeros((num_frames, num_joints, 3))
+    provided: NDArray[np.float64] = np.asarray(poses).reshape(num_frames, -1, 3)[:, :num_joints]
+    pose_params[:, :provided.shape[1]] = provided
     
-    # Global transformation matrices. 4x4 matrix
-    global_transforms: List[NDArray[np.float64]] = [np.eye(4) for _ in range(num_joints)]
+    # Local rotations for every joint of every frame in one pass
+    local_rotations: NDArray[np.float64] = axis_angle_to_rotation_matrices(
+        pose_params.reshape(-1, 3)
+    ).reshape(num_frames, num_joints, 3, 3)
+    global_rotations: NDArray[np.float64] = np.empty((num_frames, num_joints, 3, 3))
     
-    for i in range(num_joints): # for each joint
-        # convert from axis-angle to rotation matrix
-        if i < len(pose_params):
-            # rot_mat is a 3x3 rotation matrix
-            rot_mat: NDArray[np.float64] = axis_angle_to_rotation_matrix(pose_params[i])
-        else:
-            rot_mat = np.eye(3)
-        
-        # create a new local transform:
-        local_transform: NDArray[np.float64] = np.eye(4)
-        local_transform[:3, :3] = rot_mat # use the rotations from the pose/animation data
-        local_transform[:3, 3] = SMPL_OFFSETS[i] # use the local position offsets from hard-coded SMPL-H skeleton at the top of the file
-        
-        # Global transform
+    # Root joint - apply global translation
+    global_rotations[:, 0] = local_rotations[:, 0]
+    joint_positions[:, 0] = SMPL_OFFSETS[0] + trans
+    
+    # Parents always come before their children in SMPL_H_PARENTS
+    for i in range(1, num_joints):
         parent_idx: int = int(SMPL_H_PARENTS[i])
-        if parent_idx == -1:
-            # Root joint - apply global translation
-            global_transforms[i] = local_transform
-            global_transforms[i][:3, 3] += trans
-        else:
-            global_transforms[i] = global_transforms[parent_idx] @ local_transform
-        
-        joint_positions[i] = global_transforms[i][:3, 3]
+        parent_rotations: NDArray[np.float64] = global_rotations[:, parent_idx]
+        global_rotations[:, i] = parent_rotations @ local_rotations[:, i]
+        joint_positions[:, i] = joint_positions[:, parent_idx] + parent_rotations @ SMPL_OFFSETS[i]
     
     return joint_positions
 
+# converts a single frame of NPZ animation data to global joint positions
+def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
+    """EXACT SAME FUNCTION AS MATPLOTLIB SCRIPT (single-frame view of forward_kinematics_batch)"""
+    return forward_kinematics_batch(poses[np.newaxis], np.asarray(trans)[np.newaxis])[0]
+
 
 def apply_json_pose_to_frame0(armature: bpy.types.Object, json_filepath: str) -> None:
     """
@@ -293,7 +298,9 @@ def process_npz_file(
     
     # Compute joint positions for first frame to create armature - THIS IS CRITICAL!
     # Using actual frame 0 pose data instead of T-pose ensures correct bone orientations
-    joint_positions_frame0: NDArray[np.float64] = forward_kinematics(poses[0], trans[0])
+    # FK for the whole clip in one batched pass; frame 0 builds the armature
+    all_joint_positions: NDArray[np.float64] = forward_kinematics_batch(poses, trans)
+    joint_positions_frame0: NDArray[np.float64] = all_joint_positions[0]
     print("Using frame 0 pose (from FK) for armature creation")
     
     # Create armature
@@ -358,7 +365,7 @@ def process_npz_file(
         bpy.context.scene.frame_set(frame_idx)
         
         # Compute joint positions using EXACT SAME forward kinematics
-        joint_positions: NDArray[np.float64] = forward_kinematics(poses[frame_idx], trans[frame_idx])
+        joint_positions: NDArray[np.float64] = all_joint_positions[frame_idx]
         
         # Set empty positions
         for i in range(52):
@@ -19,6 +19,13 @@ SMPL_H_PARENTS: NDArray[np.int32] = np.array([
     49, 50,
 ], dtype=np.int32)
 
+# Joints grouped by depth in the kinematic tree: every joint in a level only
+# depends on joints in earlier levels, so FK can process a whole level at once
+JOINT_DEPTHS: NDArray[np.int32] = np.zeros(52, dtype=np.int32)
+for i in range(1, 52):
+    JOINT_DEPTHS[i] = JOINT_DEPTHS[SMPL_H_PARENTS[i]] + 1
+JOINT_LEVELS: List[NDArray[np.int64]] = [np.flatnonzero(JOINT_DEPTHS == d) for d in range(JOINT_DEPTHS.max() + 1)]
+
 # Joint names - Original correct names
 JOINT_NAMES: List[str] = [
     "Pelvis", "L_Hip", "R_Hip", "Spine1", "L_Knee", "R_Knee", "Spine2", 
@@ -68,64 +75,75 @@ for i in range(52):
         SMPL_OFFSETS[i] = J_ABSOLUTE[i] - J_ABSOLUTE[parent_idx]
 
 
-def axis_angle_to_rotation_matrix(axis_angle: NDArray[np.float64]) -> NDArray[np.float64]:
-    """Convert axis-angle to rotation matrix using Rodrigues' formula"""
-    angle: float = np.linalg.norm(axis_angle)
-    if angle < 1e-6:
-        return np.eye(3)
-    
-    # Normalize axis
-    axis: NDArray[np.float64] = axis_angle / angle
+def axis_angle_to_rotation_matrices(axis_angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Convert (N, 3) axis-angle vectors to (N, 3, 3) rotation matrices using Rodrigues' formula"""
+    # All-zero input (rest pose) is all identity; skip the norm and Rodrigues work
+    if not axis_angles.any():
+        return np.broadcast_to(np.eye(3), (len(axis_angles), 3, 3)).copy()
+    
+    angles: NDArray[np.float64] = np.linalg.norm(axis_angles, axis=1, keepdims=True)
+    
+    # Normalize axes (zero rotations keep a zero axis and end up as identity)
+    axes: NDArray[np.float64] = axis_angles / np.where(angles < 1e-6, 1.0, angles)
+    
+    # Skew-symmetric cross-product matrices, one per joint
+    K: NDArray[np.float64] = np.zeros((len(axis_angles), 3, 3))
+    K[:, 0, 1] = -axes[:, 2]
+    K[:, 0, 2] = axes[:, 1]
+    K[:, 1, 0] = axes[:, 2]
+    K[:, 1, 2] = -axes[:, 0]
+    K[:, 2, 0] = -axes[:, 1]
+    K[:, 2, 1] = axes[:, 0]
     
     # Rodrigues' rotation formula
-    K: NDArray[np.float64] = np.array([
-        [0, -axis[2], axis[1]],
-        [axis[2], 0, -axis[0]],
-        [-axis[1], axis[0], 0]
-    ])
-    
-    R: NDArray[np.float64] = np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * (K @ K)
+    sin_angles: NDArray[np.float64] = np.sin(angles)[:, :, np.newaxis]
+    cos_angles: NDArray[np.float64] = np.cos(angles)[:, :, np.newaxis]
+    R: NDArray[np.float64] = np.eye(3) + sin_angles * K + (1 - cos_angles) * np.einsum('nij,njk->nik', K, K)
     return R
 
-# converts a single frame of NPZ animation data to global transformations (4x4) for each joint
-def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
-    """EXACT SAME FUNCTION AS MATPLOTLIB SCRIPT"""
-    num_joints: int = len(SMPL_H_PARENTS)
-    joint_positions: NDArray[np.float64] = np.zeros((num_joints, 3))
-    
-    # Reshape poses: (156,) -> (52, 3) for 52 joints
-    # Axis-angle parameters for each joint - directly from the npz file
-    pose_params: NDArray[np.float64] = poses.reshape(-1, 3)
-    
-    # Global transformation matrices. 4x4 matrix
-    global_transforms: List[NDArray[np.float64]] = [np.eye(4) for _ in range(num_joints)]
+# converts a whole NPZ animation to global joint positions
+def forward_kinematics_batch(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Forward kinematics for all frames at once: (T, D) poses + (T, 3) trans -> (T, 52, 3).
     
-    for i in range(num_joints): # for each joint
-        # convert from axis-angle to rotation matrix
-        if i < len(pose_params):
-            # rot_mat is a 3x3 rotation matrix
-            rot_mat: NDArray[np.float64] = axis_angle_to_rotation_matrix(pose_params[i])
-        else:
-            rot_mat = np.eye(3)
-        
-        # create a new local transform:
-        local_transform: NDArray[np.float64] = np.eye(4)
-        local_transform[:3, :3] = rot_mat # use the rotations from the pose/animation data
-        local_transform[:3, 3] = SMPL_OFFSETS[i] # use the local position offsets from hard-coded SMPL-H skeleton at the top of the file
-        
-        # Global transform
-        parent_idx: int = int(SMPL_H_PARENTS[i])
-        if parent_idx == -1:
-            # Root joint - apply global translation
-            global_transforms[i] = local_transform
-            global_transforms[i][:3, 3] += trans
-        else:
-            global_transforms[i] = global_transforms[parent_idx] @ local_transform
-        
-        joint_positions[i] = global_transforms[i][:3, 3]
+    Same math as forward_kinematics, with the frame axis carried through every
+    NumPy call so the tree walk is 11 level steps for the whole clip.
+    """
+    num_frames: int = len(poses)
+    num_joints: int = len(SMPL_H_PARENTS)
+    joint_positions: NDArray[np.float64] = np.zeros((num_frames, num_joints, 3))
+    
+    # Reshape poses: (T, D) -> (T, 52, 3); missing joints stay at identity
+    pose_params: NDArray[np.float64] = np.zeros((num_frames, num_joints, 3))
+    provided: NDArray[np.float64] = np.asarray(poses).reshape(num_frames, -1, 3)[:, :num_joints]
+    pose_params[:, :provided.shape[1]] = provided
+    
+    # All local rotations for all frames in one pass
+    local_rotations: NDArray[np.float64] = axis_angle_to_rotation_matrices(
+        pose_params.reshape(-1, 3)
+    ).reshape(num_frames, num_joints, 3, 3)
+    global_rotations: NDArray[np.float64] = np.empty((num_frames, num_joints, 3, 3))
+    
+    # Root joint - apply global translation
+    global_rotations[:, 0] = local_rotations[:, 0]
+    joint_positions[:, 0] = SMPL_OFFSETS[0] + trans
+    
+    # Walk the tree one depth level at a time, every frame together
+    for level in JOINT_LEVELS[1:]:
+        parents: NDArray[np.int32] = SMPL_H_PARENTS[level]
+        parent_rotations: NDArray[np.float64] = global_rotations[:, parents]
+        global_rotations[:, level] = parent_rotations @ local_rotations[:, level]
+        joint_positions[:, level] = (
+            np.einsum('tnij,nj->tni', parent_rotations, SMPL_OFFSETS[level]) + joint_positions[:, parents]
+        )
     
     return joint_positions
 
+# converts a single frame of NPZ animation data to global joint positions
+def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
+    """EXACT SAME FUNCTION AS MATPLOTLIB SCRIPT (single-frame view of forward_kinematics_batch)"""
+    return forward_kinematics_batch(poses[np.newaxis], np.asarray(trans)[np.newaxis])[0]
+
 
 def clear_all_data_blocks() -> None:
     """
@@ -225,6 +243,11 @@ def process_npz_file(
     # Clear ALL data blocks (not just objects) - FIXED
     clear_all_data_blocks()
     
+    # Resolve context members once instead of through RNA on every use
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    collection = bpy.context.collection
+    
     # Load NPZ file
     data = np.load(str(npz_path))
     poses: NDArray[np.float64] = data['poses']
@@ -237,17 +260,20 @@ def process_npz_file(
     print(f"Poses shape: {poses.shape}")
     print(f"Trans shape: {trans.shape}")
     
+    # Joint positions for every frame in one batched FK call
+    all_joint_positions: NDArray[np.float64] = forward_kinematics_batch(poses, trans)
+    
     # Compute joint positions for first frame to create armature - THIS IS CRITICAL!
     # Using actual frame 0 pose data instead of T-pose ensures correct bone orientations
-    joint_positions_frame0: NDArray[np.float64] = forward_kinematics(poses[0], trans[0])
+    joint_positions_frame0: NDArray[np.float64] = all_joint_positions[0]
     print("Using frame 0 pose (from FK) for armature creation")
     
     # Create armature with UNIQUE name per file - FIXED
     unique_name = f"SMPL_H_Armature_{npz_path.stem}"
     armature_data = bpy.data.armatures.new(unique_name)
     armature: bpy.types.Object = bpy.data.objects.new(unique_name, armature_data)
-    bpy.context.collection.objects.link(armature)
-    bpy.context.view_layer.objects.active = armature
+    collection.objects.link(armature)
+    view_layer.objects.active = armature
     
     # Create bones
     bpy.ops.object.mode_set(mode='EDIT')
@@ -283,9 +309,9 @@ def process_npz_file(
     bpy.ops.object.mode_set(mode='OBJECT')
     
     # Set frame range
-    bpy.context.scene.frame_start = 0
-    bpy.context.scene.frame_end = len(poses) - 1
-    bpy.context.scene.render.fps = int(framerate)
+    scene.frame_start = 0
+    scene.frame_end = len(poses) - 1
+    scene.render.fps = int(framerate)
     
     print("Creating empties and animation...")
     
@@ -295,7 +321,7 @@ def process_npz_file(
         joint_name: str = JOINT_NAMES[i] if i < len(JOINT_NAMES) else f"Joint_{i}"
         empty_name = f"Empty_{unique_name}_{joint_name}"
         empty = bpy.data.objects.new(empty_name, None)
-        bpy.context.collection.objects.link(empty)
+        collection.objects.link(empty)
         empty.empty_display_size = 0.02
         empties.append(empty)
     
@@ -303,10 +329,10 @@ def process_npz_file(
     frame_skip: int = 1  # Keyframe every frame
     print("Processing all frames with forward kinematics (no special frame 0 handling)...")
     for frame_idx in range(0, len(poses), frame_skip):
-        bpy.context.scene.frame_set(frame_idx)
+        scene.frame_set(frame_idx)
         
-        # Compute joint positions using EXACT SAME forward kinematics
-        joint_positions: NDArray[np.float64] = forward_kinematics(poses[frame_idx], trans[frame_idx])
+        # Joint positions from the batched forward kinematics above
+        joint_positions: NDArray[np.float64] = all_joint_positions[frame_idx]
         
         # Set empty positions
         for i in range(52):
@@ -321,7 +347,7 @@ def process_npz_file(
     # Now add constraints to make armature track the empties
     print("Adding constraints to armature...")
     
-    bpy.context.view_layer.objects.active = armature
+    view_layer.objects.active = armature
     armature.select_set(True)
     bpy.ops.object.mode_set(mode='POSE')
     pose_bones = armature.pose.bones
@@ -398,7 +424,7 @@ def process_npz_file(
     # Bake constraints to keyframes on the armature
     print("Baking constraints to keyframes on armature bones...")
     
-    bpy.context.view_layer.objects.active = armature
+    view_layer.objects.active = armature
     armature.select_set(True)
     bpy.ops.object.mode_set(mode='POSE')
     
@@ -452,7 +478,7 @@ def process_npz_file(
     armature.select_set(True)
     if cube:
         cube.select_set(True)
-    bpy.context.view_layer.objects.active = armature
+    view_layer.objects.active = armature
     
     bpy.ops.export_scene.gltf(
         filepath=str(output_path),
@@ -2,20 +2,21 @@ import numpy as np
 
 # Load the NPZ file
 file_path = r"C:\Users\Astrid\data\AMASS\raw\EyesJapanDataset\Eyes_Japan_Dataset\aita\accident-02-dodge fast-aita_poses.npz"
-data = np.load(file_path)
+# Read every array out of the archive once; NpzFile re-reads from the zip on each data[key]
+with np.load(file_path) as npz:
+    data = {key: npz[key] for key in npz.files}
 
 print("=== NPZ File Structure ===\n")
 
 # List all arrays in the file
 print("Arrays in file:")
-for key in data.files:
+for key in data:
     print(f"  - {key}")
 
 print("\n=== Detailed Information ===\n")
 
 # Examine each array
-for key in data.files:
-    arr = data[key]
+for key, arr in data.items():
     print(f"Array: '{key}'")
     print(f"  Shape: {arr.shape}")
     print(f"  Dtype: {arr.dtype}")
@@ -39,8 +40,8 @@ for key in data.files:
     print()
 
 print("\n=== Summary ===")
-print(f"Total arrays: {len(data.files)}")
-if 'poses' in data.files:
+print(f"Total arrays: {len(data)}")
+if 'poses' in data:
     poses_shape = data['poses'].shape
     print(f"Animation length: {poses_shape[0]} frames")
     print(f"Pose parameters per frame: {poses_shape[1]}")
@@ -53,17 +54,17 @@ if 'poses' in data.files:
     elif poses_shape[1] == 135:
         print("  → SMPL body + one hand: 3 global + 63 body + 69 hand")
 
-if 'trans' in data.files:
+if 'trans' in data:
     print(f"Global translation: {data['trans'].shape}")
 
-if 'mocap_framerate' in data.files:
+if 'mocap_framerate' in data:
     print(f"Framerate: {data['mocap_framerate']} fps")
-    if 'poses' in data.files:
+    if 'poses' in data:
         duration = data['poses'].shape[0] / float(data['mocap_framerate'])
         print(f"Duration: {duration:.2f} seconds")
 
-if 'betas' in data.files:
+if 'betas' in data:
     print(f"Body shape parameters (betas): {data['betas'].shape}")
 
-if 'gender' in data.files:
+if 'gender' in data:
     print(f"Gender: {data['gender']}")
\ No newline at end of file
@@ -70,45 +70,67 @@ for i in range(52):
         SMPL_OFFSETS[i] = J_ABSOLUTE[i] - J_ABSOLUTE[parent_idx]
 
 
-def axis_angle_to_rotation_matrix(axis_angle: NDArray[np.float64]) -> NDArray[np.float64]:
-    """Convert axis-angle to rotation matrix"""
-    angle: float = np.linalg.norm(axis_angle)
-    if angle < 1e-6:
-        return np.eye(3)
-    
-    axis: NDArray[np.float64] = axis_angle / angle
-    K: NDArray[np.float64] = np.array([
-        [0, -axis[2], axis[1]],
-        [axis[2], 0, -axis[0]],
-        [-axis[1], axis[0], 0]
-    ])
-    R: NDArray[np.float64] = np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * (K @ K)
-    return R
+def axis_angle_to_rotation_matrices(axis_angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Convert (N, 3) axis-angle vectors to (N, 3, 3) rotation matrices (batched Rodrigues)"""
+    angles: NDArray[np.float64] = np.linalg.norm(axis_angles, axis=1, keepdims=True)
+    
+    # Zero rotations keep a zero axis and end up as identity
+    axes: NDArray[np.float64] = axis_angles / np.where(angles < 1e-6, 1.0, angles)
+    
+    K: NDArray[np.float64] = np.zeros((len(axis_angles), 3, 3))
+    K[:, 0, 1] = -axes[:, 2]
+    K[:, 0, 2] = axes[:, 1]
+    K[:, 1, 0] = axes[:, 2]
+    K[:, 1, 2] = -axes[:, 0]
+    K[:, 2, 0] = -axes[:, 1]
+    K[:, 2, 1] = axes[:, 0]
+    
+    sin_angles: NDArray[np.float64] = np.sin(angles)[:, :, np.newaxis]
+    cos_angles: NDArray[np.float64] = np.cos(angles)[:, :, np.newaxis]
+    return np.eye(3) + sin_angles * K + (1 - cos_angles) * np.einsum('nij,njk->nik', K, K)
 
 
 def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
-    """Compute forward kinematics"""
+    """
+    Compute forward kinematics
+    
+    Rotations come from one batched Rodrigues call. The parent chain is then composed
+    with plain float arithmetic on row-major 3x3 rotations: for 3x3 blocks NumPy's
+    per-call overhead costs far more than the 27 multiply-adds themselves.
+    """
     num_joints: int = len(SMPL_H_PARENTS)
-    joint_positions: NDArray[np.float64] = np.zeros((num_joints, 3))
-    pose_params: NDArray[np.float64] = poses.reshape(-1, 3)
-    global_transforms: List[NDArray[np.float64]] = [np.eye(4) for _ in range(num_joints)]
-    
-    for i in range(num_joints):
-        rot_mat = axis_angle_to_rotation_matrix(pose_params[i]) if i < len(pose_params) else np.eye(3)
-        local_transform: NDArray[np.float64] = np.eye(4)
-        local_transform[:3, :3] = rot_mat
-        local_transform[:3, 3] = SMPL_OFFSETS[i]
+    pose_params: NDArray[np.float64] = np.zeros((num_joints, 3))
+    provided: NDArray[np.float64] = poses.reshape(-1, 3)[:num_joints]
+    pose_params[:len(provided)] = provided
+    
+    local_rotations: List[List[float]] = axis_angle_to_rotation_matrices(pose_params).reshape(num_joints, 9).tolist()
+    offsets: List[List[float]] = SMPL_OFFSETS.tolist()
+    parents: List[int] = SMPL_H_PARENTS.tolist()
+    
+    # Root joint - apply global translation
+    global_rotations: List[List[float]] = [local_rotations[0]]
+    joint_positions: List[List[float]] = [[offsets[0][k] + float(trans[k]) for k in range(3)]]
+    
+    # Parents always precede their children, so index 0 is the only root
+    for i in range(1, num_joints):
+        p: int = parents[i]
+        a0, a1, a2, a3, a4, a5, a6, a7, a8 = global_rotations[p]
+        b0, b1, b2, b3, b4, b5, b6, b7, b8 = local_rotations[i]
+        ox, oy, oz = offsets[i]
+        px, py, pz = joint_positions[p]
         
-        parent_idx: int = int(SMPL_H_PARENTS[i])
-        if parent_idx == -1:
-            global_transforms[i] = local_transform
-            global_transforms[i][:3, 3] += trans
-        else:
-            global_transforms[i] = global_transforms[parent_idx] @ local_transform
-        
-        joint_positions[i] = global_transforms[i][:3, 3]
-    
-    return joint_positions
+        global_rotations.append([
+            a0 * b0 + a1 * b3 + a2 * b6, a0 * b1 + a1 * b4 + a2 * b7, a0 * b2 + a1 * b5 + a2 * b8,
+            a3 * b0 + a4 * b3 + a5 * b6, a3 * b1 + a4 * b4 + a5 * b7, a3 * b2 + a4 * b5 + a5 * b8,
+            a6 * b0 + a7 * b3 + a8 * b6, a6 * b1 + a7 * b4 + a8 * b7, a6 * b2 + a7 * b5 + a8 * b8,
+        ])
+        joint_positions.append([
+            px + a0 * ox + a1 * oy + a2 * oz,
+            py + a3 * ox + a4 * oy + a5 * oz,
+            pz + a6 * ox + a7 * oy + a8 * oz,
+        ])
+    
+    return np.array(joint_positions)
 
 
 def create_tpose_armature(name: str = "SMPLH_Armature") -> bpy.types.Object:
@@ -219,6 +241,9 @@ def retarget_animation(
     bpy.context.view_layer.objects.active = armature_obj
     bpy.ops.object.mode_set(mode='POSE')
     
+    # Resolve pose bones once rather than by name 52 times per frame
+    pose_bones = [armature_obj.pose.bones[name] for name in JOINT_NAMES]
+    
     print(f"Retargeting {num_frames} frames...")
     
     for frame_idx in range(num_frames):
@@ -231,8 +256,7 @@ def retarget_animation(
         frame_joints = forward_kinematics(poses[frame_idx], trans[frame_idx])
         
         # Apply rotations to each bone
-        for i in range(52):
-            pose_bone = armature_obj.pose.bones[JOINT_NAMES[i]]
+        for i, pose_bone in enumerate(pose_bones):
             
             # Root gets translation
             if i == 0:
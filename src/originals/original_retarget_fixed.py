@@ -10,7 +10,7 @@ import sys
 import argparse
 from pathlib import Path
 from typing import List, Optional
-from mathutils import Vector, Quaternion
+from mathutils import Vector
 from numpy.typing import NDArray
 
 
@@ -70,48 +70,99 @@ for i in range(52):
     else:
         SMPL_OFFSETS[i] = J_ABSOLUTE[i] - J_ABSOLUTE[parent_idx]
 
+# Joints grouped by depth in the kinematic tree; a level only depends on earlier levels
+JOINT_DEPTHS: NDArray[np.int32] = np.zeros(52, dtype=np.int32)
+for i in range(1, 52):
+    JOINT_DEPTHS[i] = JOINT_DEPTHS[SMPL_H_PARENTS[i]] + 1
+JOINT_LEVELS: List[NDArray[np.int64]] = [np.flatnonzero(JOINT_DEPTHS == d) for d in range(JOINT_DEPTHS.max() + 1)]
 
-def axis_angle_to_rotation_matrix(axis_angle: NDArray[np.float64]) -> NDArray[np.float64]:
-    """Convert axis-angle to rotation matrix"""
-    angle: float = np.linalg.norm(axis_angle)
-    if angle < 1e-6:
-        return np.eye(3)
-    
-    axis: NDArray[np.float64] = axis_angle / angle
-    K: NDArray[np.float64] = np.array([
-        [0, -axis[2], axis[1]],
-        [axis[2], 0, -axis[0]],
-        [-axis[1], axis[0], 0]
-    ])
-    R: NDArray[np.float64] = np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * (K @ K)
-    return R
+# Children of each joint, built once; FIRST_CHILD is the joint each bone points toward (-1 for end bones)
+CHILDREN: List[List[int]] = [[] for _ in range(52)]
+for j, parent in enumerate(SMPL_H_PARENTS.tolist()):
+    if parent >= 0:
+        CHILDREN[parent].append(j)
+FIRST_CHILD: NDArray[np.int32] = np.array([c[0] if c else -1 for c in CHILDREN], dtype=np.int32)
+FIRST_CHILD[0] = 3  # Pelvis points to Spine1
 
 
-def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
-    """Compute forward kinematics"""
+def axis_angle_to_rotation_matrices(axis_angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Convert (N, 3) axis-angle vectors to (N, 3, 3) rotation matrices (batched Rodrigues)"""
+    angles: NDArray[np.float64] = np.linalg.norm(axis_angles, axis=1, keepdims=True)
+    
+    # Zero rotations keep a zero axis and end up as identity
+    axes: NDArray[np.float64] = axis_angles / np.where(angles < 1e-6, 1.0, angles)
+    
+    K: NDArray[np.float64] = np.zeros((len(axis_angles), 3, 3))
+    K[:, 0, 1] = -axes[:, 2]
+    K[:, 0, 2] = axes[:, 1]
+    K[:, 1, 0] = axes[:, 2]
+    K[:, 1, 2] = -axes[:, 0]
+    K[:, 2, 0] = -axes[:, 1]
+    K[:, 2, 1] = axes[:, 0]
+    
+    sin_angles: NDArray[np.float64] = np.sin(angles)[:, :, np.newaxis]
+    cos_angles: NDArray[np.float64] = np.cos(angles)[:, :, np.newaxis]
+    return np.eye(3) + sin_angles * K + (1 - cos_angles) * np.einsum('nij,njk->nik', K, K)
+
+
+def _fk_rotmats(poses: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Local (F, 52, 3, 3) rotations from (F, D) axis-angle poses; missing joints stay at identity"""
+    num_frames: int = len(poses)
     num_joints: int = len(SMPL_H_PARENTS)
-    joint_positions: NDArray[np.float64] = np.zeros((num_joints, 3))
-    pose_params: NDArray[np.float64] = poses.reshape(-1, 3)
-    global_transforms: List[NDArray[np.float64]] = [np.eye(4) for _ in range(num_joints)]
-    
-    for i in range(num_joints):
-        rot_mat = axis_angle_to_rotation_matrix(pose_params[i]) if i < len(pose_params) else np.eye(3)
-        local_transform: NDArray[np.float64] = np.eye(4)
-        local_transform[:3, :3] = rot_mat
-        local_transform[:3, 3] = SMPL_OFFSETS[i]
-        
-        parent_idx: int = int(SMPL_H_PARENTS[i])
-        if parent_idx == -1:
-            global_transforms[i] = local_transform
-            global_transforms[i][:3, 3] += trans
-        else:
-            global_transforms[i] = global_transforms[parent_idx] @ local_transform
-        
-        joint_positions[i] = global_transforms[i][:3, 3]
+    pose_params: NDArray[np.float64] = np.zeros((num_frames, num_joints, 3))
+    provided: NDArray[np.float64] = np.asarray(poses).reshape(num_frames, -1, 3)[:, :num_joints]
+    pose_params[:, :provided.shape[1]] = provided
+    
+    # Joints that never rotate in this clip (e.g. hands in body-only data) stay identity without Rodrigues
+    active: NDArray[np.bool_] = (np.linalg.norm(pose_params, axis=2) >= 1e-6).any(axis=0)
+    local_rotations: NDArray[np.float64] = np.broadcast_to(np.eye(3), (num_frames, num_joints, 3, 3)).copy()
+    local_rotations[:, active] = axis_angle_to_rotation_matrices(
+        pose_params[:, active].reshape(-1, 3)
+    ).reshape(num_frames, -1, 3, 3)
+    return local_rotations
+
+
+def _fk_chain(local_rotations: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Chain (F, 52, 3, 3) local rotations down the tree into (F, 52, 3) joint positions, one depth level per step"""
+    num_frames: int = len(local_rotations)
+    num_joints: int = len(SMPL_H_PARENTS)
+    global_rotations: NDArray[np.float64] = np.empty((num_frames, num_joints, 3, 3))
+    joint_positions: NDArray[np.float64] = np.empty((num_frames, num_joints, 3))
+    
+    # Root joint - apply global translation
+    global_rotations[:, 0] = local_rotations[:, 0]
+    joint_positions[:, 0] = SMPL_OFFSETS[0] + trans
+    
+    # 11 batched level steps instead of 52 per-joint steps, all frames together
+    for level in JOINT_LEVELS[1:]:
+        parents: NDArray[np.int32] = SMPL_H_PARENTS[level]
+        parent_rotations: NDArray[np.float64] = global_rotations[:, parents]
+        global_rotations[:, level] = parent_rotations @ local_rotations[:, level]
+        joint_positions[:, level] = (
+            joint_positions[:, parents] + np.einsum('fnij,nj->fni', parent_rotations, SMPL_OFFSETS[level])
+        )
     
     return joint_positions
 
 
+def forward_kinematics_batch(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Forward kinematics for a whole animation: (F, D) poses + (F, 3) trans -> (F, 52, 3)"""
+    return _fk_chain(_fk_rotmats(poses), trans)
+
+
+def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Compute forward kinematics for a single frame (rotation + translation per joint, no 4x4 matrices)"""
+    return forward_kinematics_batch(poses[np.newaxis], np.asarray(trans)[np.newaxis])[0]
+
+
+# T-pose joints and bone rest directions only depend on SMPL_OFFSETS, so compute them once per run
+TPOSE_JOINTS: NDArray[np.float64] = forward_kinematics(np.zeros(52 * 3), np.zeros(3))
+REST_DIRS: NDArray[np.float64] = np.zeros((52, 3))  # unit head->tail, zero for end bones
+_bones_with_child = FIRST_CHILD >= 0
+REST_DIRS[_bones_with_child] = TPOSE_JOINTS[FIRST_CHILD[_bones_with_child]] - TPOSE_JOINTS[_bones_with_child]
+REST_DIRS[_bones_with_child] /= np.linalg.norm(REST_DIRS[_bones_with_child], axis=1, keepdims=True)
+
+
 def clear_all_data_blocks() -> None:
     """
     Clear all Blender data blocks to ensure clean state between files.
@@ -154,9 +205,7 @@ def create_tpose_armature(name: str = "SMPLH_Armature") -> bpy.types.Object:
         Created armature object with bone length and rest direction info
     """
     # Use T-pose (zero poses)
-    zero_poses = np.zeros((52, 3), dtype=np.float64).flatten()
-    zero_trans = np.zeros(3, dtype=np.float64)
-    tpose_joints = forward_kinematics(zero_poses, zero_trans)
+    tpose_joints = TPOSE_JOINTS
     
     # Create armature
     armature = bpy.data.armatures.new(name)
@@ -171,12 +220,8 @@ def create_tpose_armature(name: str = "SMPLH_Armature") -> bpy.types.Object:
         bone = edit_bones.new(JOINT_NAMES[i])
         bone.head = Vector(tpose_joints[i])
         
-        children = [j for j in range(52) if SMPL_H_PARENTS[j] == i]
-        if children:
-            if i == 0:
-                bone.tail = Vector(tpose_joints[3])  # Spine1
-            else:
-                bone.tail = Vector(tpose_joints[children[0]])
+        if FIRST_CHILD[i] >= 0:
+            bone.tail = Vector(tpose_joints[FIRST_CHILD[i]])
         else:
             bone.tail = Vector(tpose_joints[i]) + Vector((0, 0.05, 0))
     
@@ -192,28 +237,98 @@ def create_tpose_armature(name: str = "SMPLH_Armature") -> bpy.types.Object:
     return armature_obj
 
 
-def compute_bone_rotation(bone_head: Vector, bone_tail: Vector, target_pos: Vector) -> Quaternion:
+def compute_bone_rotations(
+    bone_heads: NDArray[np.float64],
+    rest_dirs: NDArray[np.float64],
+    target_positions: NDArray[np.float64]
+) -> NDArray[np.float64]:
     """
-    Compute rotation needed to make bone point from head toward target
+    Compute rotations needed to make bones point from head toward target, for all frames at once
     
     Args:
-        bone_head: Bone head position in rest pose
-        bone_tail: Bone tail position in rest pose  
-        target_pos: Target position to point toward
+        bone_heads: Bone head positions in rest pose (num_bones, 3)
+        rest_dirs: Unit rest directions, head toward tail (num_bones, 3)
+        target_positions: Target positions to point toward (num_frames, num_bones, 3)
         
     Returns:
-        Quaternion rotation
+        Shortest-arc quaternions (w, x, y, z) rotating rest to target (num_frames, num_bones, 4)
     """
-    # Rest direction (bone's default orientation)
-    rest_dir = (bone_tail - bone_head).normalized()
-    
     # Target direction
-    target_dir = (target_pos - bone_head).normalized()
+    target_dirs = target_positions - bone_heads
+    target_dirs /= np.linalg.norm(target_dirs, axis=-1, keepdims=True)
+    
+    # Shortest-arc quaternion from rest to target: (1 + dot, cross), normalized - no trig needed
+    w = 1.0 + np.einsum('fij,ij->fi', target_dirs, rest_dirs)
+    xyz = np.cross(rest_dirs, target_dirs)
+    
+    # Anti-parallel directions leave (w, xyz) at zero: rotate 180 degrees about any axis perpendicular to rest
+    anti_parallel = w < 1e-6
+    if anti_parallel.any():
+        perpendicular_axes = np.cross(rest_dirs, [0.0, 0.0, 1.0])
+        parallel_to_up = np.linalg.norm(perpendicular_axes, axis=-1) < 1e-6
+        perpendicular_axes[parallel_to_up] = np.cross(rest_dirs[parallel_to_up], [1.0, 0.0, 0.0])
+        perpendicular_axes /= np.linalg.norm(perpendicular_axes, axis=-1, keepdims=True)
+        
+        w = np.where(anti_parallel, 0.0, w)
+        xyz = np.where(anti_parallel[..., np.newaxis], perpendicular_axes, xyz)
+    
+    rotations = np.concatenate([w[..., np.newaxis], xyz], axis=-1)
+    rotations /= np.linalg.norm(rotations, axis=-1, keepdims=True)
+    
+    return rotations
+
+
+def align_quaternion_hemispheres(quaternions: NDArray[np.float64]) -> None:
+    """
+    Flip signs in place so consecutive frames' quaternions have a non-negative dot product
+    
+    q and -q are the same rotation, but Blender interpolates each fcurve channel on
+    its own, so a sign change between keys would swing through the long arc.
     
-    # Compute rotation from rest to target
-    rotation = rest_dir.rotation_difference(target_dir)
+    Args:
+        quaternions: Per-frame quaternions (num_frames, num_bones, 4)
+    """
+    dots = np.einsum('fbc,fbc->fb', quaternions[:-1], quaternions[1:])
+    signs = np.cumprod(np.where(dots < 0, -1.0, 1.0), axis=0)
+    quaternions[1:] *= signs[..., np.newaxis]
+
+
+def changed_frames(values: NDArray[np.float64], tolerance: float = 1e-6) -> NDArray[np.int64]:
+    """
+    Frames that need a keyframe to reproduce a per-frame channel
     
-    return rotation
+    Args:
+        values: Channel values per frame (num_frames, num_components)
+        tolerance: Largest frame-to-frame change still treated as static
+        
+    Returns:
+        Indices of the first and last frame plus both ends of every change;
+        the interior of static runs is dropped
+    """
+    moved = np.linalg.norm(np.diff(values, axis=0), axis=-1) > tolerance
+    keep = np.zeros(len(values), dtype=bool)
+    keep[[0, -1]] = True
+    keep[1:] |= moved
+    keep[:-1] |= moved
+    return np.flatnonzero(keep)
+
+
+def add_fcurve_keys(
+    action: bpy.types.Action,
+    data_path: str,
+    index: int,
+    frames: NDArray[np.float64],
+    values: NDArray[np.float64],
+    action_group: str
+) -> None:
+    """Create one fcurve and write all of its keyframes with a single foreach_set"""
+    fcurve = action.fcurves.new(data_path=data_path, index=index, action_group=action_group)
+    keyframe_coords = np.empty((len(frames), 2), dtype=np.float32)
+    keyframe_coords[:, 0] = frames
+    keyframe_coords[:, 1] = values
+    fcurve.keyframe_points.add(len(frames))
+    fcurve.keyframe_points.foreach_set("co", keyframe_coords.ravel())
+    fcurve.update()
 
 
 def retarget_animation(
@@ -233,65 +348,54 @@ def retarget_animation(
     """
     num_frames = len(poses)
     
-    # Get T-pose joint positions for reference
-    zero_poses = np.zeros((52, 3), dtype=np.float64).flatten()
-    zero_trans = np.zeros(3, dtype=np.float64)
-    tpose_joints = forward_kinematics(zero_poses, zero_trans)
+    # Bone rest info as parallel arrays (-1 marks bones without a child)
+    child_idx = FIRST_CHILD
+    has_child = child_idx >= 0
+    bone_heads = TPOSE_JOINTS
     
-    # Store bone rest info
-    bone_info = []
-    for i in range(52):
-        children = [j for j in range(52) if SMPL_H_PARENTS[j] == i]
-        child_idx = children[0] if children else None
-        if i == 0 and children:
-            child_idx = 3  # Pelvis points to Spine1
-        
-        bone_info.append({
-            'head': Vector(tpose_joints[i]),
-            'tail': Vector(tpose_joints[child_idx]) if child_idx is not None else None,
-            'child_idx': child_idx
-        })
+    print(f"Retargeting {num_frames} frames...")
+    
+    # FK positions for every frame in one batched pass
+    all_joints = forward_kinematics_batch(poses, trans)
+    
+    # Bone rotations for every frame, computed before touching Blender
+    bone_rotations = np.zeros((num_frames, 52, 4))
+    bone_rotations[..., 0] = 1.0
+    bone_rotations[:, has_child] = compute_bone_rotations(
+        bone_heads[has_child],
+        REST_DIRS[has_child],
+        all_joints[:, child_idx[has_child]]
+    )
+    align_quaternion_hemispheres(bone_rotations)
     
     # Create a new action with unique name - FIXED
+    # Keys are written straight into its fcurves, so it goes on the object the pose bones belong to
     action = bpy.data.actions.new(action_name)
-    armature_obj.data.animation_data_create()
-    armature_obj.data.animation_data.action = action
+    armature_obj.animation_data_create()
+    armature_obj.animation_data.action = action
     
-    # Animate
     bpy.context.view_layer.objects.active = armature_obj
     bpy.ops.object.mode_set(mode='POSE')
     
-    print(f"Retargeting {num_frames} frames...")
-    
-    for frame_idx in range(num_frames):
-        if frame_idx % 100 == 0:
-            print(f"  Frame {frame_idx}/{num_frames}")
-        
-        bpy.context.scene.frame_set(frame_idx)
+    # Only key the frames where a channel actually changes (static finger joints collapse to two keys)
+    for i, bone_name in enumerate(JOINT_NAMES):
+        pose_bone = armature_obj.pose.bones[bone_name]
+        bone_path = f'pose.bones["{bone_name}"]'
+        pose_bone.location = Vector((0, 0, 0))
         
-        # Compute FK positions for this frame
-        frame_joints = forward_kinematics(poses[frame_idx], trans[frame_idx])
+        # Root gets translation
+        if i == 0:
+            frames = changed_frames(all_joints[:, 0])
+            for c in range(3):
+                add_fcurve_keys(action, f"{bone_path}.location", c, frames, all_joints[frames, 0, c], bone_name)
         
-        # Apply rotations to each bone
-        for i in range(52):
-            pose_bone = armature_obj.pose.bones[JOINT_NAMES[i]]
-            
-            # Root gets translation
-            if i == 0:
-                pose_bone.location = Vector(frame_joints[i])
-                pose_bone.keyframe_insert(data_path="location", frame=frame_idx)
-            else:
-                pose_bone.location = Vector((0, 0, 0))
-            
-            # Compute rotation
-            info = bone_info[i]
-            if info['child_idx'] is not None:
-                target_pos = Vector(frame_joints[info['child_idx']])
-                rotation = compute_bone_rotation(info['head'], info['tail'], target_pos)
-                
-                pose_bone.rotation_mode = 'QUATERNION'
-                pose_bone.rotation_quaternion = rotation
-                pose_bone.keyframe_insert(data_path="rotation_quaternion", frame=frame_idx)
+        if has_child[i]:
+            pose_bone.rotation_mode = 'QUATERNION'
+            frames = changed_frames(bone_rotations[:, i])
+            for c in range(4):
+                add_fcurve_keys(
+                    action, f"{bone_path}.rotation_quaternion", c, frames, bone_rotations[frames, i, c], bone_name
+                )
     
     bpy.ops.object.mode_set(mode='OBJECT')
     print("Retargeting complete!")
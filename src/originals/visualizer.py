@@ -101,31 +101,24 @@ def forward_kinematics(poses, trans):
     # Reshape poses: (156,) -> (52, 3) for 52 joints
     pose_params = poses.reshape(-1, 3)
     
-    # Global transformation matrices
-    global_transforms = [np.eye(4) for _ in range(num_joints)]
+    # Local rotations from axis-angle (identity for joints without pose params)
+    local_rotations = np.broadcast_to(np.eye(3), (num_joints, 3, 3)).copy()
+    for i in range(min(num_joints, len(pose_params))):
+        local_rotations[i] = axis_angle_to_rotation_matrix(pose_params[i])
     
-    for i in range(num_joints):
-        # Local rotation from axis-angle
-        if i < len(pose_params):
-            rot_mat = axis_angle_to_rotation_matrix(pose_params[i])
-        else:
-            rot_mat = np.eye(3)
-        
-        # Local transform
-        local_transform = np.eye(4)
-        local_transform[:3, :3] = rot_mat
-        local_transform[:3, 3] = SMPL_OFFSETS[i]
-        
-        # Global transform
+    # Global rotations; positions are the global translations
+    global_rotations = np.empty((num_joints, 3, 3))
+    
+    # Root joint (always index 0) - apply global translation
+    global_rotations[0] = local_rotations[0]
+    joint_positions[0] = SMPL_OFFSETS[0] + trans
+    
+    # Parents always precede children, so no root check is needed in the loop
+    for i in range(1, num_joints):
         parent_idx = SMPL_H_PARENTS[i]
-        if parent_idx == -1:
-            # Root joint - apply global translation
-            global_transforms[i] = local_transform
-            global_transforms[i][:3, 3] += trans
-        else:
-            global_transforms[i] = global_transforms[parent_idx] @ local_transform
-        
-        joint_positions[i] = global_transforms[i][:3, 3]
+        parent_rotation = global_rotations[parent_idx]
+        global_rotations[i] = parent_rotation @ local_rotations[i]
+        joint_positions[i] = joint_positions[parent_idx] + parent_rotation @ SMPL_OFFSETS[i]
     
     return joint_positions
 
@@ -2,6 +2,8 @@ import bpy
 import numpy as np
 import sys
 import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List
 from mathutils import Vector
@@ -18,6 +20,20 @@ SMPL_H_PARENTS: NDArray[np.int32] = np.array([
     49, 50,
 ], dtype=np.int32)
 
+# Same parents as native Python ints, for scalar loops that would otherwise box/cast a numpy int32 per joint
+PARENTS_LIST: List[int] = SMPL_H_PARENTS.tolist()
+
+# First child of each joint (-1 for leaf joints), built in a single pass over the parents
+FIRST_CHILD: NDArray[np.int32] = np.full(52, -1, dtype=np.int32)
+for j in range(52):
+    p = PARENTS_LIST[j]
+    if p >= 0 and FIRST_CHILD[p] < 0:
+        FIRST_CHILD[p] = j
+
+# Joint each bone's tail points at (-1 for leaf bones); Pelvis points to Spine1
+CHILD_IDX_FOR_BONE: NDArray[np.int32] = FIRST_CHILD.copy()
+CHILD_IDX_FOR_BONE[0] = 3
+
 # Joint names (52 entries)
 JOINT_NAMES: List[str] = [
     "Pelvis", "L_Hip", "R_Hip", "Spine1", "L_Knee", "R_Knee", "Spine2", 
@@ -28,7 +44,7 @@ JOINT_NAMES: List[str] = [
 
 # T-pose joint positions from the original SMPL-H template
 # Mocap rotations are relative to T-pose, so we need T-pose bone directions for FK
-J_ABSOLUTE: NDArray[np.float64] = np.array([
+J_ABSOLUTE: NDArray[np.float32] = np.array([
     [-0.001795, -0.223333, 0.028219], [0.067725, -0.314740, 0.021404],
     [-0.069466, -0.313855, 0.023899], [-0.004328, -0.114370, 0.001523],
     [0.102001, -0.689938, 0.016908], [-0.107756, -0.696424, 0.015049],
@@ -55,13 +71,14 @@ J_ABSOLUTE: NDArray[np.float64] = np.array([
     [-0.779985, 0.211294, -0.069581], [-0.807581, 0.213016, -0.074152],
     [-0.829999, 0.211622, -0.081116], [-0.722013, 0.199415, -0.016553],
     [-0.739452, 0.200249, 0.007932], [-0.760794, 0.195263, 0.022366],
-])
+], dtype=np.float32)
 
 # Compute RELATIVE offsets from T-pose J_ABSOLUTE
 # These are used in forward kinematics - mocap rotations are relative to T-pose
-SMPL_OFFSETS: NDArray[np.float64] = np.zeros((52, 3))
+# Stored as float32: mm-scale joint offsets have ample precision headroom and FK runs twice as wide
+SMPL_OFFSETS: NDArray[np.float32] = np.zeros((52, 3), dtype=np.float32)
 for i in range(52):
-    parent_idx = SMPL_H_PARENTS[i]
+    parent_idx = PARENTS_LIST[i]
     if parent_idx == -1:
         SMPL_OFFSETS[i] = J_ABSOLUTE[i]
     else:
@@ -122,8 +139,8 @@ def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -
     # Reshape poses: (156,) -> (52, 3) for 52 joints
     pose_params: NDArray[np.float64] = poses.reshape(-1, 3)
     
-    # Global transformation matrices
-    global_transforms: List[NDArray[np.float64]] = [np.eye(4) for _ in range(num_joints)]
+    # Global rotations and positions kept separately - a 4x4 transform's bottom row is always [0, 0, 0, 1]
+    global_rotations: NDArray[np.float64] = np.empty((num_joints, 3, 3))
     
     for i in range(num_joints):
         # Local rotation from axis-angle
@@ -132,25 +149,95 @@ def forward_kinematics(poses: NDArray[np.float64], trans: NDArray[np.float64]) -
         else:
             rot_mat = np.eye(3)
         
-        # Local transform
-        local_transform: NDArray[np.float64] = np.eye(4)
-        local_transform[:3, :3] = rot_mat
-        local_transform[:3, 3] = SMPL_OFFSETS[i]
-        
         # Global transform
-        parent_idx: int = int(SMPL_H_PARENTS[i])
+        parent_idx: int = PARENTS_LIST[i]
         if parent_idx == -1:
             # Root joint - apply global translation
-            global_transforms[i] = local_transform
-            global_transforms[i][:3, 3] += trans
+            global_rotations[i] = rot_mat
+            joint_positions[i] = SMPL_OFFSETS[i] + trans
         else:
-            global_transforms[i] = global_transforms[parent_idx] @ local_transform
-        
-        joint_positions[i] = global_transforms[i][:3, 3]
+            global_rotations[i] = global_rotations[parent_idx] @ rot_mat
+            joint_positions[i] = global_rotations[parent_idx] @ SMPL_OFFSETS[i] + joint_positions[parent_idx]
     
     return joint_positions
 
 
+def axis_angle_to_rotation_matrices_batch(axis_angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Convert an (..., 3) array of axis-angle vectors to (..., 3, 3) rotation matrices."""
+    angles: NDArray[np.float64] = np.linalg.norm(axis_angles, axis=-1, keepdims=True)
+    axes: NDArray[np.float64] = axis_angles / np.where(angles < 1e-6, 1.0, angles)
+
+    K: NDArray[np.float64] = np.zeros(axis_angles.shape[:-1] + (3, 3), dtype=axis_angles.dtype)
+    K[..., 0, 1] = -axes[..., 2]
+    K[..., 0, 2] = axes[..., 1]
+    K[..., 1, 0] = axes[..., 2]
+    K[..., 1, 2] = -axes[..., 0]
+    K[..., 2, 0] = -axes[..., 1]
+    K[..., 2, 1] = axes[..., 0]
+
+    # One sin pass yields both: cos(a) = sin(a + pi/2)
+    sin_angles, cos_angles = np.sin(np.stack([angles, angles + np.pi / 2]))[..., np.newaxis]
+    R: NDArray[np.float64] = np.eye(3, dtype=axis_angles.dtype) + sin_angles * K + (1 - cos_angles) * (K @ K)
+
+    # Zero rotations (e.g. unused hand joints) are exactly identity, matching the scalar version
+    R[angles[..., 0] < 1e-6] = np.eye(3, dtype=axis_angles.dtype)
+    return R
+
+
+def forward_kinematics_batch(poses: NDArray[np.floating], trans: NDArray[np.floating]) -> NDArray[np.float32]:
+    """Run forward kinematics for every frame at once, returning (num_frames, 52, 3) joint positions."""
+    num_frames: int = len(poses)
+    num_joints: int = len(SMPL_H_PARENTS)
+
+    # Reshape poses: (F, 156) -> (F, 52, 3); joints missing from the input stay at identity
+    pose_params: NDArray[np.float32] = np.zeros((num_frames, num_joints, 3), dtype=SMPL_OFFSETS.dtype)
+    provided = poses.reshape(num_frames, -1, 3)[:, :num_joints]
+    pose_params[:, :provided.shape[1]] = provided
+
+    local_rotations: NDArray[np.float32] = axis_angle_to_rotation_matrices_batch(pose_params)
+    global_rotations: NDArray[np.float32] = np.empty_like(local_rotations)
+    joint_positions: NDArray[np.float32] = np.empty((num_frames, num_joints, 3), dtype=local_rotations.dtype)
+
+    for i in range(num_joints):
+        parent_idx: int = PARENTS_LIST[i]
+        if parent_idx == -1:
+            # Root joint - apply global translation
+            global_rotations[:, i] = local_rotations[:, i]
+            joint_positions[:, i] = SMPL_OFFSETS[i] + trans
+        else:
+            global_rotations[:, i] = np.einsum('fjk,fkl->fjl', global_rotations[:, parent_idx], local_rotations[:, i])
+            joint_positions[:, i] = (
+                np.einsum('fjk,k->fj', global_rotations[:, parent_idx], SMPL_OFFSETS[i])
+                + joint_positions[:, parent_idx]
+            )
+
+    return joint_positions
+
+
+def keyframe_locations(
+    obj: bpy.types.Object,
+    frames: NDArray[np.int64],
+    locations: NDArray[np.floating]
+) -> None:
+    """Write location keyframes for all frames at once through the object's fcurves.
+
+    Axes that never move get a single keyframe at the first frame instead of one per frame.
+    """
+    obj.animation_data_create()
+    action = bpy.data.actions.new(f"{obj.name}_Action")
+    obj.animation_data.action = action
+
+    keyframe_coords = np.empty(2 * len(frames), dtype=np.float32)
+    keyframe_coords[0::2] = frames
+    for axis in range(3):
+        fcurve = action.fcurves.new(data_path="location", index=axis)
+        keyframe_coords[1::2] = locations[:, axis]
+        num_keyframes = 1 if np.ptp(locations[:, axis]) < 1e-5 else len(frames)
+        fcurve.keyframe_points.add(num_keyframes)
+        fcurve.keyframe_points.foreach_set("co", keyframe_coords[:2 * num_keyframes])
+        fcurve.update()
+
+
 def add_cube_and_parent(
     armature: bpy.types.Object,
     cube_size: float = 0.05,
@@ -180,63 +267,23 @@ def add_cube_and_parent(
     return cube
 
 
-def process_npz_file(
-    npz_path: Path,
-    cube_size: float = 0.05,
-    cube_location: tuple[float, float, float] = (0.0, 0.0, 0.0),
-    frame_limit: Optional[int] = None,
-    j_absolute_apose: Optional[NDArray[np.float64]] = None
-) -> None:
-    """Retarget one NPZ file and export the resulting GLB."""
-    print(f"\n{'='*80}")
-    print(f"Processing: {npz_path}")
-    print(f"{'='*80}")
-    
+def clear_scene() -> None:
+    """Delete all objects and the mesh, armature and action data blocks they leave behind."""
     bpy.ops.object.select_all(action='SELECT')
     bpy.ops.object.delete()
     
-    # Clear all animation data to prevent cross-contamination between files
     for action in bpy.data.actions:
         bpy.data.actions.remove(action)
     for mesh in bpy.data.meshes:
         bpy.data.meshes.remove(mesh)
     for armature in bpy.data.armatures:
         bpy.data.armatures.remove(armature)
-    
-    # Load NPZ file
-    data = np.load(str(npz_path))
-    poses: NDArray[np.float64] = data['poses']
-    trans: NDArray[np.float64] = data['trans']
-
-    total_frames: int = len(poses)
 
-    if frame_limit is not None:
-        if frame_limit <= 0:
-            raise ValueError(f"frame_limit must be a positive integer, got {frame_limit}")
 
-        frames_to_use = min(frame_limit, total_frames)
-        if frames_to_use < total_frames:
-            print(f"Frame limit applied: using first {frames_to_use} of {total_frames} frames")
-            poses = poses[:frames_to_use]
-            trans = trans[:frames_to_use]
-        else:
-            print(f"Frame limit ({frame_limit}) exceeds available frames; using all {total_frames}")
-
-    if len(poses) == 0:
-        raise ValueError(f"No frames available after applying frame limit for {npz_path}")
-    
-    # Get framerate (default to 60 if not present)
-    framerate: float = float(data.get('mocap_framerate', 60))
-    
-    print(f"Loaded {len(poses)} frames at {framerate} fps")
-    print(f"Poses shape: {poses.shape}")
-    print(f"Trans shape: {trans.shape}")
-    
-    if j_absolute_apose is None:
-        raise ValueError("A-pose joint positions were not provided to process_npz_file")
-
-    joint_positions_frame0: NDArray[np.float64] = j_absolute_apose  # forward_kinematics(poses[0], trans[0])
-    print("Using frame 0 pose (from FK) for armature creation")
+def create_target_armature(j_absolute_apose: NDArray[np.float32]) -> bpy.types.Object:
+    """Build the SMPL-H armature in the A-pose; its geometry is the same for every file in a run."""
+    joint_positions_frame0: NDArray[np.float32] = j_absolute_apose  # forward_kinematics(poses[0], trans[0])
+    print("Using A-pose for armature creation")
     
     # Align root to reference pelvis position
     reference_pelvis = load_reference_pelvis(j_absolute_apose)
@@ -262,9 +309,8 @@ def process_npz_file(
         bone.head = Vector(joint_positions_frame0[i])
 
         # Set tail pointing toward first child or slightly offset
-        child_indices: List[int] = [j for j in range(52) if SMPL_H_PARENTS[j] == i]
-        if child_indices:
-            target_idx = 3 if i == 0 else child_indices[0]
+        target_idx: int = int(CHILD_IDX_FOR_BONE[i])
+        if target_idx != -1:
             bone.tail = Vector(joint_positions_frame0[target_idx])
         else:
             bone.tail = Vector(joint_positions_frame0[i]) + Vector((0, 0.05, 0))
@@ -273,12 +319,91 @@ def process_npz_file(
     
     # Set parent relationships
     for i in range(52):
-        parent_idx: int = int(SMPL_H_PARENTS[i])
+        parent_idx: int = PARENTS_LIST[i]
         if parent_idx != -1:
             bone_list[i].parent = bone_list[parent_idx]
     
     bpy.ops.object.mode_set(mode='OBJECT')
     
+    return armature
+
+
+def reset_armature_animation(armature: bpy.types.Object) -> None:
+    """
+    Clear the previous file's animation so the armature can be reused for the next one.
+
+    Also drops any tracking constraints and Empty_* objects left behind when a
+    previous file failed before its bake cleared them.
+    """
+    if armature.mode != 'OBJECT':
+        bpy.context.view_layer.objects.active = armature
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    armature.animation_data_clear()
+    for action in list(bpy.data.actions):
+        bpy.data.actions.remove(action)
+
+    for obj in list(bpy.data.objects):
+        if obj.type == 'EMPTY' and obj.name.startswith("Empty_"):
+            bpy.data.objects.remove(obj, do_unlink=True)
+
+    for pose_bone in armature.pose.bones:
+        for constraint in list(pose_bone.constraints):
+            pose_bone.constraints.remove(constraint)
+        pose_bone.location = (0.0, 0.0, 0.0)
+        pose_bone.rotation_quaternion = (1.0, 0.0, 0.0, 0.0)
+        pose_bone.rotation_euler = (0.0, 0.0, 0.0)
+        pose_bone.scale = (1.0, 1.0, 1.0)
+
+
+def process_npz_file(
+    npz_path: Path,
+    armature: bpy.types.Object,
+    cube: bpy.types.Object,
+    frame_limit: Optional[int] = None,
+    j_absolute_apose: Optional[NDArray[np.float32]] = None
+) -> None:
+    """Retarget one NPZ file onto the shared armature and export the resulting GLB."""
+    print(f"\n{'='*80}")
+    print(f"Processing: {npz_path}")
+    print(f"{'='*80}")
+    
+    # Clear all animation data to prevent cross-contamination between files
+    reset_armature_animation(armature)
+    
+    # Load NPZ file
+    # Cast once to the float32 working dtype used by forward_kinematics_batch
+    data = np.load(str(npz_path))
+    poses: NDArray[np.float32] = np.ascontiguousarray(data['poses'], dtype=np.float32)
+    trans: NDArray[np.float32] = np.ascontiguousarray(data['trans'], dtype=np.float32)
+
+    total_frames: int = len(poses)
+
+    if frame_limit is not None:
+        if frame_limit <= 0:
+            raise ValueError(f"frame_limit must be a positive integer, got {frame_limit}")
+
+        frames_to_use = min(frame_limit, total_frames)
+        if frames_to_use < total_frames:
+            print(f"Frame limit applied: using first {frames_to_use} of {total_frames} frames")
+            poses = poses[:frames_to_use]
+            trans = trans[:frames_to_use]
+        else:
+            print(f"Frame limit ({frame_limit}) exceeds available frames; using all {total_frames}")
+
+    if len(poses) == 0:
+        raise ValueError(f"No frames available after applying frame limit for {npz_path}")
+    
+    # Get framerate (default to 60 if not present)
+    framerate: float = float(data.get('mocap_framerate', 60))
+    
+    print(f"Loaded {len(poses)} frames at {framerate} fps")
+    print(f"Poses shape: {poses.shape}")
+    print(f"Trans shape: {trans.shape}")
+    
+    if j_absolute_apose is None:
+        raise ValueError("A-pose joint positions were not provided to process_npz_file")
+
     bpy.context.scene.frame_start = 0
     bpy.context.scene.frame_end = len(poses) - 1
     bpy.context.scene.render.fps = int(framerate)
@@ -294,28 +419,18 @@ def process_npz_file(
         empty.empty_display_size = 0.02
         empties.append(empty)
     
+    # Compute joint positions for every frame up front so keyframes can be written in bulk
+    all_joint_positions: NDArray[np.float32] = forward_kinematics_batch(poses, trans)
+
     # Frame 0: keyframe Blender A-pose world positions directly
-    bpy.context.scene.frame_set(0)
-    for i, empty in enumerate(empties):
-        empty.location = Vector(j_absolute_apose[i])
-        empty.keyframe_insert(data_path="location", frame=0)
+    all_joint_positions[0] = j_absolute_apose
 
     # Animate empties using computed forward kinematics for remaining frames
     keyframe_step: int = 1  # Keyframe every frame
+    keyframe_frames: NDArray[np.int64] = np.concatenate([[0], np.arange(1, len(poses), keyframe_step)])
     print("Processing frames 1..N with forward kinematics (frame 0 uses Blender A-pose)...")
-    for frame_idx in range(1, len(poses), keyframe_step):
-        bpy.context.scene.frame_set(frame_idx)
-        
-        # Compute joint positions using EXACT SAME forward kinematics
-        joint_positions: NDArray[np.float64] = forward_kinematics(poses[frame_idx], trans[frame_idx])
-        
-        # Set empty positions
-        for i in range(52):
-            empties[i].location = Vector(joint_positions[i])
-            empties[i].keyframe_insert(data_path="location", frame=frame_idx)
-        
-        if frame_idx % 100 == 0:
-            print(f"  Processed frame {frame_idx}/{len(poses)}")
+    for i, empty in enumerate(empties):
+        keyframe_locations(empty, keyframe_frames, all_joint_positions[keyframe_frames, i])
     
     print("Empties animation complete!")
     
@@ -332,7 +447,7 @@ def process_npz_file(
         pose_bone = pose_bones.get(joint_name)
         
         if pose_bone:
-            child_indices = [j for j in range(52) if SMPL_H_PARENTS[j] == i]
+            child_idx: int = int(CHILD_IDX_FOR_BONE[i])
 
             # Root bone (Pelvis) - special handling
             if i == 0:
@@ -345,13 +460,12 @@ def process_npz_file(
                 track_constraint.name = "Track_To_Spine1"
                 track_constraint.track_axis = 'TRACK_Y'
             
-            elif len(child_indices) == 0:
+            elif child_idx == -1:
                 track_constraint = pose_bone.constraints.new('COPY_LOCATION')
                 track_constraint.target = empties[i]
                 track_constraint.name = "Track_End_Location"
             
             else:
-                child_idx: int = child_indices[0]
                 track_constraint = pose_bone.constraints.new('COPY_LOCATION')
                 track_constraint.target = empties[i]
                 track_constraint.name = f"Track_To_Child_{i}"
@@ -392,8 +506,6 @@ def process_npz_file(
     
     print("Empties removed. Ready for export.")
     
-    cube: bpy.types.Object = add_cube_and_parent(armature, cube_size, cube_location)
-    
     # Export to GLB with "retargeted" in filename
     output_path: Path = npz_path.with_stem(npz_path.stem + '_retargeted').with_suffix('.glb')
     
@@ -425,6 +537,49 @@ def find_npz_files(folder_path: Path) -> List[Path]:
     return sorted(folder_path.rglob("*.npz"))
 
 
+def run_parallel(
+    npz_files: List[Path],
+    num_workers: int,
+    apose_path: Path,
+    cube_size: float,
+    cube_location: List[float],
+    frame_limit: Optional[int]
+) -> int:
+    """Retarget each NPZ in its own background Blender process and return the number of failures."""
+    def worker_command(npz_file: Path) -> List[str]:
+        command = [
+            bpy.app.binary_path, "--background", "--python-exit-code", "1",
+            "--python", str(Path(__file__).resolve()), "--",
+            str(npz_file),
+            "--apose-path", str(apose_path),
+            "--cube-size", str(cube_size),
+            "--cube-location", *(str(v) for v in cube_location),
+        ]
+        if frame_limit is not None:
+            command += ["--frame-limit", str(frame_limit)]
+        return command
+
+    # Blender scene state is not thread-safe, so each file gets an isolated process;
+    # threads here only wait on those processes
+    failures = 0
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = {
+            executor.submit(subprocess.run, worker_command(npz_file), capture_output=True, text=True): npz_file
+            for npz_file in npz_files
+        }
+        for idx, future in enumerate(as_completed(futures), 1):
+            npz_file = futures[future]
+            result = future.result()
+            print(result.stdout)
+            if result.returncode == 0:
+                print(f"[{idx}/{len(npz_files)}] ✓ Successfully processed {npz_file.name}")
+            else:
+                failures += 1
+                print(result.stderr)
+                print(f"[{idx}/{len(npz_files)}] ✗ Error processing {npz_file.name} (exit code {result.returncode})")
+    return failures
+
+
 def main() -> None:
     argv = sys.argv
     if "--" in argv:
@@ -438,7 +593,7 @@ def main() -> None:
     parser.add_argument(
         "input_folder",
         type=str,
-        help="Path to folder containing NPZ files (will search recursively)"
+        help="Path to folder containing NPZ files (will search recursively), or a single NPZ file"
     )
     parser.add_argument(
         "--limit",
@@ -446,6 +601,13 @@ def main() -> None:
         default=None,
         help="Limit the number of files to process (for testing)"
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Process files in N separate Blender processes at once"
+    )
     parser.add_argument(
         "--frame-limit",
         type=int,
@@ -501,7 +663,7 @@ def main() -> None:
     if 'J_ABSOLUTE' not in apose_data:
         print(f"Error: {apose_path} missing 'J_ABSOLUTE'")
         sys.exit(1)
-    J_absolute_apose = apose_data['J_ABSOLUTE']
+    J_absolute_apose = np.ascontiguousarray(apose_data['J_ABSOLUTE'], dtype=np.float32)
     print(f"Loaded A-pose from {apose_path}")
 
     # Handle A-pose export mode early
@@ -535,17 +697,14 @@ def main() -> None:
                 for i in range(52):
                     bone = edit_bones.new(JOINT_NAMES[i] if i < len(JOINT_NAMES) else f"Joint_{i}")
                     bone.head = Vector(J[i])
-                    children = [j for j in range(52) if SMPL_H_PARENTS[j] == i]
-                    if children:
-                        if i == 0:
-                            bone.tail = Vector(J[3])
-                        else:
-                            bone.tail = Vector(J[children[0]])
+                    child_idx = CHILD_IDX_FOR_BONE[i]
+                    if child_idx != -1:
+                        bone.tail = Vector(J[child_idx])
                     else:
                         bone.tail = Vector(J[i]) + Vector((0, 0.05, 0))
                 # Parents
                 bone_list = list(edit_bones)
-                for i, parent_idx in enumerate(SMPL_H_PARENTS):
+                for i, parent_idx in enumerate(PARENTS_LIST):
                     if parent_idx != -1:
                         bone_list[i].parent = bone_list[parent_idx]
                 bpy.ops.object.mode_set(mode='OBJECT')
@@ -591,12 +750,14 @@ def main() -> None:
         print(f"Error: Input folder does not exist: {input_folder}")
         sys.exit(1)
     
-    if not input_folder.is_dir():
-        print(f"Error: Input path is not a directory: {input_folder}")
-        sys.exit(1)
-    
     # Find all NPZ files
-    npz_files = find_npz_files(input_folder)
+    if input_folder.is_file() and input_folder.suffix == '.npz':
+        npz_files = [input_folder]
+    elif input_folder.is_dir():
+        npz_files = find_npz_files(input_folder)
+    else:
+        print(f"Error: Input path is not a directory or NPZ file: {input_folder}")
+        sys.exit(1)
     
     if not npz_files:
         print(f"No NPZ files found in {input_folder}")
@@ -608,14 +769,36 @@ def main() -> None:
     
     print(f"\nFound {len(npz_files)} NPZ file(s) to process")
     
+    if args.parallel and args.parallel > 1 and len(npz_files) > 1:
+        failures = run_parallel(
+            npz_files,
+            args.parallel,
+            apose_path,
+            args.cube_size,
+            args.cube_location,
+            args.frame_limit
+        )
+        print(f"\n{'='*80}")
+        print(f"Batch processing complete! Processed {len(npz_files)} file(s), {failures} failed")
+        print(f"{'='*80}")
+        if failures:
+            sys.exit(1)
+        return
+    
+    # The armature and cube only depend on the A-pose, so build them once and reuse them per file
+    clear_scene()
+    armature = create_target_armature(J_absolute_apose)
+    cube = add_cube_and_parent(armature, args.cube_size, tuple(args.cube_location))
+    
     # Process each file
+    failures = 0
     for idx, npz_file in enumerate(npz_files, 1):
         print(f"\n[{idx}/{len(npz_files)}] Processing: {npz_file.name}")
         try:
             process_npz_file(
                 npz_file,
-                args.cube_size,
-                tuple(args.cube_location),
+                armature,
+                cube,
                 args.frame_limit,
                 J_absolute_apose
             )
@@ -624,11 +807,14 @@ def main() -> None:
             print(f"✗ Error processing {npz_file.name}: {e}")
             import traceback
             traceback.print_exc()
+            failures += 1
             continue
     
     print(f"\n{'='*80}")
-    print(f"Batch processing complete! Processed {len(npz_files)} file(s)")
+    print(f"Batch processing complete! Processed {len(npz_files)} file(s), {failures} failed")
     print(f"{'='*80}")
+    if failures:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
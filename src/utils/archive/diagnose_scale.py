@@ -18,8 +18,12 @@ USAGE:
 ============================================================================
 """
 import numpy as np
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from smpl_constants import REFERENCE_NPZ_PATH
+
 # Animation data hardcoded J_ABSOLUTE (from create_glb_from_npz.py - the working animations)
 J_ANIM = np.array([
     [-0.001795, -0.223333, 0.028219], [0.067725, -0.314740, 0.021404],
@@ -29,7 +33,7 @@ J_ANIM = np.array([
 
 def main():
     # Load FBX-extracted reference
-    ref_path = Path(__file__).parent.parent.parent / 'data' / 'reference' / 'smplh_target_reference.npz'
+    ref_path = REFERENCE_NPZ_PATH
     ref = np.load(str(ref_path))
     J_FBX = ref['J_ABSOLUTE']
     
@@ -23,40 +23,65 @@ EXAMPLE:
 """
 import numpy as np
 import sys
+import zipfile
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from npz_io import read_npy_header
+
+def read_npz_headers(npz_path):
+    """Read {key: (shape, dtype)} for every array in an .npz without loading array data"""
+    headers = {}
+    with zipfile.ZipFile(npz_path) as archive:
+        for member_name in archive.namelist():
+            with archive.open(member_name) as member:
+                shape, _, dtype = read_npy_header(member)
+            headers[member_name.removesuffix('.npy')] = (shape, dtype)
+    return headers
+
+def read_npz_first_row(npz_path, key):
+    """Read only row 0 of one array in an .npz, streaming just those bytes from the archive"""
+    with zipfile.ZipFile(npz_path) as archive, archive.open(f"{key}.npy") as member:
+        shape, fortran_order, dtype = read_npy_header(member)
+        if fortran_order or len(shape) == 0 or dtype.hasobject:
+            # Row 0 is not a contiguous prefix of the data; fall back to a full read
+            member.seek(0)
+            return np.lib.format.read_array(member)[0]
+        row_shape = shape[1:]
+        row_bytes = member.read(int(np.prod(row_shape)) * dtype.itemsize)
+        return np.frombuffer(row_bytes, dtype=dtype).reshape(row_shape)
+
 def load_npz_file(npz_path):
     """Load and display information about an AMASS .npz file"""
     data = np.load(npz_path)
+    headers = read_npz_headers(npz_path)
     
     print(f"\n{'='*60}")
     print(f"File: {npz_path.name}")
     print(f"{'='*60}")
     
     print(f"\nKeys in file:")
-    for key in data.keys():
-        val = data[key]
-        if hasattr(val, 'shape'):
-            print(f"  {key}: shape {val.shape}, dtype {val.dtype}")
-        else:
-            print(f"  {key}: {type(val)}")
+    for key, (shape, dtype) in headers.items():
+        print(f"  {key}: shape {shape}, dtype {dtype}")
     
     # Focus on the key data
-    if 'poses' in data and 'trans' in data:
-        poses = data['poses']
-        trans = data['trans']
-        print(f"\nPoses: {poses.shape} - {poses.shape[0]} frames")
-        print(f"Translations: {trans.shape}")
+    if 'poses' in headers and 'trans' in headers:
+        poses_shape = headers['poses'][0]
+        trans_shape = headers['trans'][0]
+        print(f"\nPoses: {poses_shape} - {poses_shape[0]} frames")
+        print(f"Translations: {trans_shape}")
         print(f"Framerate: {data.get('mocap_framerate', 'unknown')}")
         
+        pose_0 = read_npz_first_row(npz_path, 'poses')
+        trans_0 = read_npz_first_row(npz_path, 'trans')
         print(f"\nFrame 0 (first frame):")
-        print(f"  Pose params shape: {poses[0].shape}")
-        print(f"  Translation: {trans[0]}")
+        print(f"  Pose params shape: {pose_0.shape}")
+        print(f"  Translation: {trans_0}")
         
         # Show joint parameters
-        if poses[0].shape[0] == 156:  # SMPL-H: 52 joints * 3 axis-angle
+        if pose_0.shape[0] == 156:  # SMPL-H: 52 joints * 3 axis-angle
             print(f"  This is SMPL-H format (52 joints × 3)")
-            print(f"  First 10 joint params: {poses[0][:10]}")
+            print(f"  First 10 joint params: {pose_0[:10]}")
     
     return data
 
@@ -80,16 +105,18 @@ def compare_frame_0(npz_files, num_samples=5):
     
     frame_0_data = []
     for npz_file in samples:
-        data = np.load(npz_file)
-        if 'poses' in data and 'trans' in data:
+        headers = read_npz_headers(npz_file)
+        if 'poses' in headers and 'trans' in headers:
+            pose_0 = read_npz_first_row(npz_file, 'poses')
+            trans_0 = read_npz_first_row(npz_file, 'trans')
             frame_0_data.append({
                 'file': npz_file.name,
-                'pose': data['poses'][0],
-                'trans': data['trans'][0]
+                'pose': pose_0,
+                'trans': trans_0
             })
             print(f"\n{npz_file.name}:")
-            print(f"  Translation: {data['trans'][0]}")
-            print(f"  Pose params (first 9): {data['poses'][0][:9]}")
+            print(f"  Translation: {trans_0}")
+            print(f"  Pose params (first 9): {pose_0[:9]}")
     
     # Calculate statistics
     if len(frame_0_data) > 1:
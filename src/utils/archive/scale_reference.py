@@ -25,10 +25,13 @@ import numpy as np
 from pathlib import Path
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from smpl_constants import REFERENCE_NPZ_PATH
+
 def main():
     # Allow scale factor as command line argument
     scale_factor = float(sys.argv[1]) if len(sys.argv) > 1 else 0.4
-    ref_path = Path(__file__).parent.parent.parent / 'data' / 'reference' / 'smplh_target_reference.npz'
+    ref_path = REFERENCE_NPZ_PATH
     
     # Load current reference
     ref = np.load(str(ref_path))
@@ -0,0 +1,93 @@
+"""
+============================================================================
+BLENDER DEBUG HELPERS
+============================================================================
+
+PURPOSE:
+    Shared scene setup for the debug, validation and reference scripts: clear
+    the scene, import a GLB, find its armature, and resolve the SMPL-H bones
+    once so the per-bone loops can index plain Python lists instead of looking
+    up names. Also builds the template T-pose armature.
+
+USAGE:
+    Scripts under src/utils/ add src/utils to sys.path and import from here:
+
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from blender_debug import import_glb_and_get_armature
+============================================================================
+"""
+import bpy
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from smpl_constants import JOINT_NAMES, J_ABSOLUTE_TPOSE, SMPL_H_PARENTS_LIST, CHILDREN_OF
+
+
+def clear_scene() -> None:
+    """Delete all objects and the actions, meshes and armatures they leave behind."""
+    # One bulk removal; no selection needed and no per-ID collection rebuilds
+    bpy.data.batch_remove(ids=[
+        *bpy.data.objects, *bpy.data.actions, *bpy.data.meshes, *bpy.data.armatures
+    ])
+
+
+def import_glb_and_get_armature(
+    glb_path: Path
+) -> Tuple[bpy.types.Object, List[Optional[bpy.types.PoseBone]], List[Optional[bpy.types.Bone]]]:
+    """
+    Import a GLB into an empty scene and return its armature and SMPL-H bones.
+
+    Returns:
+        (armature_obj, pose_bones, data_bones) where both bone lists are ordered
+        like JOINT_NAMES, with None for joints the armature doesn't have.
+        data_bones[i].head_local is the rest-pose head in armature space (same as
+        the edit bone head, without entering edit mode).
+
+    Raises:
+        RuntimeError: if the GLB contains no armature
+    """
+    clear_scene()
+    bpy.ops.import_scene.gltf(filepath=str(glb_path))
+
+    armature_obj = next((obj for obj in bpy.context.scene.objects if obj.type == 'ARMATURE'), None)
+    if not armature_obj:
+        raise RuntimeError(f"No armature found in {glb_path}")
+
+    pose_bones = armature_obj.pose.bones
+    data_bones = armature_obj.data.bones
+    pose_bone_list = [pose_bones.get(name) for name in JOINT_NAMES]
+    data_bone_list = [data_bones.get(name) for name in JOINT_NAMES]
+    return armature_obj, pose_bone_list, data_bone_list
+
+
+def create_tpose_armature(name: str = "SMPL_H_Armature") -> bpy.types.Object:
+    """
+    Clear the scene and build an SMPL-H armature at the template T-pose.
+
+    Tails point at each joint's first child (end bones get a short +Y stub), and
+    every pose bone is set to quaternion rotation mode.
+    """
+    clear_scene()
+    armature_data = bpy.data.armatures.new(name)
+    armature_obj = bpy.data.objects.new(name, armature_data)
+    bpy.context.collection.objects.link(armature_obj)
+    bpy.context.view_layer.objects.active = armature_obj
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = armature_data.edit_bones
+    for i, joint_name in enumerate(JOINT_NAMES):
+        bone = edit_bones.new(joint_name)
+        x, y, z = J_ABSOLUTE_TPOSE[i].tolist()
+        bone.head = (x, y, z)
+        children = CHILDREN_OF[i]
+        bone.tail = J_ABSOLUTE_TPOSE[children[0]].tolist() if children else (x, y + 0.05, z)
+    bone_list = list(edit_bones)
+    for i, parent_idx in enumerate(SMPL_H_PARENTS_LIST):
+        if parent_idx != -1:
+            bone_list[i].parent = bone_list[parent_idx]
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    # Pose bones are reachable from OBJECT mode; no POSE mode round trip needed
+    for pose_bone in armature_obj.pose.bones:
+        pose_bone.rotation_mode = 'QUATERNION'
+    return armature_obj
@@ -12,6 +12,9 @@ from pathlib import Path
 from typing import Optional, Tuple
 from numpy.typing import NDArray
 
+from npz_io import load_npz_mmap
+from smpl_constants import SMPL_H_PARENTS
+
 
 def explore_npz_betas(npz_path: Path) -> None:
     """Explore betas in an NPZ file"""
@@ -19,7 +22,8 @@ def explore_npz_betas(npz_path: Path) -> None:
     print(f"Exploring betas in: {npz_path}")
     print(f"{'='*80}\n")
     
-    data = np.load(str(npz_path))
+    # Only betas is read; the pose arrays stay on disk
+    data = load_npz_mmap(npz_path)
     
     if 'betas' not in data:
         print("❌ No betas found in this NPZ file")
@@ -147,9 +151,7 @@ def compute_j_absolute_from_betas(
     # v = v_template + sum(beta_i * shapedirs[:, :, i])
     if shapedirs.ndim == 3:
         # shapedirs is (num_verts, 3, num_betas)
-        v_posed = v_template.copy()
-        for i in range(num_betas):
-            v_posed += betas_used[i] * shapedirs[:, :, i]
+        v_posed = v_template + np.einsum('vci,i->vc', shapedirs[:, :, :num_betas], betas_used)
     else:
         # shapedirs might be flattened, need to reshape
         # This is model-specific
@@ -176,27 +178,13 @@ def compute_smpl_offsets_from_j_absolute(j_absolute: NDArray[np.float64]) -> NDA
     Returns:
         SMPL_OFFSETS (52, 3)
     """
-    from numpy.typing import NDArray
-    
-    SMPL_H_PARENTS = np.array([
-        -1, 0, 0, 0, 1, 2, 3, 4, 5, 6,
-        7, 8, 9, 9, 9, 12, 13, 14, 16, 17,
-        18, 19, 20, 22, 23, 20, 25, 26, 20, 28,
-        29, 20, 31, 32, 20, 34, 35, 21, 37, 38,
-        21, 40, 41, 21, 43, 44, 21, 46, 47, 21,
-        49, 50,
-    ], dtype=np.int32)
-    
-    smpl_offsets = np.zeros((52, 3))
+    # Child joints: offset is relative to parent (gather the parents, subtract once)
+    parents = SMPL_H_PARENTS.copy()
+    parents[0] = 0
+    smpl_offsets = j_absolute - j_absolute[parents]
     
-    for i in range(52):
-        parent_idx = SMPL_H_PARENTS[i]
-        if parent_idx == -1:
-            # Root joint - offset is just the position
-            smpl_offsets[i] = j_absolute[i]
-        else:
-            # Child joint - offset is relative to parent
-            smpl_offsets[i] = j_absolute[i] - j_absolute[parent_idx]
+    # Root joint - offset is just the position
+    smpl_offsets[0] = j_absolute[0]
     
     return smpl_offsets
 
@@ -223,8 +211,7 @@ def main():
         print("ATTEMPTING TO COMPUTE ORIGINAL BONE LENGTHS FROM BETAS")
         print("="*80)
         
-        data = np.load(str(npz_path))
-        betas = data['betas']
+        betas = np.array(load_npz_mmap(npz_path)['betas'])
         
         try:
             j_absolute, method = compute_j_absolute_from_betas(betas, smpl_model_path)
@@ -236,7 +223,7 @@ def main():
                 print(f"  Joint {i:2d}: [{j_absolute[i,0]:8.6f}, {j_absolute[i,1]:8.6f}, {j_absolute[i,2]:8.6f}]")
             
             print(f"\nSMPL_OFFSETS statistics:")
-            bone_lengths = [np.linalg.norm(smpl_offsets[i]) for i in range(1, 52)]
+            bone_lengths = np.linalg.norm(smpl_offsets[1:], axis=1)
             print(f"  Average bone length: {np.mean(bone_lengths):.6f} m")
             print(f"  Min bone length: {np.min(bone_lengths):.6f} m")
             print(f"  Max bone length: {np.max(bone_lengths):.6f} m")
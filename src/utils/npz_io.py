@@ -0,0 +1,92 @@
+"""
+============================================================================
+NPZ HELPERS
+============================================================================
+
+PURPOSE:
+    Shared NPZ loading for the utility scripts that only need a few arrays (or
+    a few rows) out of large AMASS archives, plus the A-pose rotation writer
+    used by the reference scripts. No Blender imports, so plain Python can use it.
+
+USAGE:
+    Scripts in src/utils/ import from here directly:
+
+        from npz_io import load_npz_mmap, read_npy_header, save_apose_rotations
+============================================================================
+"""
+import ast
+import numpy as np
+import struct
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Dict, Tuple
+
+
+def read_npy_header(member: BinaryIO) -> Tuple[Tuple[int, ...], bool, np.dtype]:
+    """
+    Read (shape, fortran_order, dtype) from the start of a .npy stream, leaving it at the array data.
+    
+    Handles all three .npy format versions. NumPy only exposes readers for 1.0 and 2.0;
+    3.0 is the 2.0 layout with a UTF-8 header, so it is parsed here.
+    """
+    version = np.lib.format.read_magic(member)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(member)
+    if version == (2, 0):
+        return np.lib.format.read_array_header_2_0(member)
+    if version == (3, 0):
+        (header_len,) = struct.unpack('<I', member.read(4))
+        header = ast.literal_eval(member.read(header_len).decode('utf8'))
+        return tuple(header['shape']), header['fortran_order'], np.lib.format.descr_to_dtype(header['descr'])
+    raise ValueError(f"Unsupported .npy format version {version}")
+
+
+def load_npz_mmap(npz_path: Path) -> Dict[str, np.ndarray]:
+    """
+    Open every array in an NPZ without reading it into memory.
+    
+    np.load ignores mmap_mode for .npz archives, but members written uncompressed
+    (np.savez) are plain .npy files inside the zip and can be memory-mapped in place,
+    so only the rows that are actually touched get read. Compressed, scalar and
+    object members fall back to a regular load; like np.load, pickled (object)
+    members are refused rather than unpickled.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(npz_path) as archive, open(npz_path, 'rb') as raw:
+        for info in archive.infolist():
+            key = info.filename[:-len('.npy')] if info.filename.endswith('.npy') else info.filename
+            with archive.open(info) as member:
+                shape, fortran_order, dtype = read_npy_header(member)
+                npy_header_size = member.tell()
+                
+                if info.compress_type != zipfile.ZIP_STORED or len(shape) == 0 or dtype.hasobject:
+                    member.seek(0)
+                    arrays[key] = np.lib.format.read_array(member, allow_pickle=False)
+                    continue
+            
+            # Member data starts after the zip local file header (30 bytes + name + extra field)
+            raw.seek(info.header_offset + 26)
+            name_len, extra_len = struct.unpack('<HH', raw.read(4))
+            data_offset = info.header_offset + 30 + name_len + extra_len + npy_header_size
+            arrays[key] = np.memmap(
+                npz_path, dtype=dtype, mode='r', shape=shape,
+                order='F' if fortran_order else 'C', offset=data_offset
+            )
+    return arrays
+
+
+def save_apose_rotations(rotations: Dict[str, np.ndarray], output_path: Path) -> None:
+    """
+    Write per-bone [w, x, y, z] quaternions to an NPZ.
+    
+    Stored as one (N, 4) 'rotations' array plus the matching 'joint_names', so the
+    archive has two members instead of one per bone; rotations[i] belongs to
+    joint_names[i], in the insertion order of the input dict.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        output_path,
+        rotations=np.stack(list(rotations.values())).astype(np.float64),
+        joint_names=np.array(list(rotations.keys())),
+    )
+
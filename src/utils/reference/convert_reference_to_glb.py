@@ -13,7 +13,10 @@ RELEVANCE: ✅ ACTIVE - Useful utility for creating reference GLBs
 MILESTONE: M2+ (Reference generation)
 
 USAGE:
-    blender --background --python convert_reference_to_glb.py -- <NUM_FRAMES> [OUTPUT_PATH]
+    blender --background --python convert_reference_to_glb.py -- <NUM_FRAMES> [OUTPUT_PATH] [--dense]
+
+    By default only the first and last frame are keyed (constant interpolation),
+    which still spans the full frame range. Pass --dense to key every frame.
 
 EXAMPLE:
     blender --background --python convert_reference_to_glb.py -- 10 data/reference/reference_apose_10frames.glb
@@ -22,27 +25,52 @@ EXAMPLE:
 import bpy
 import numpy as np
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from mathutils import Vector
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from smpl_constants import JOINT_NAMES, SMPL_H_PARENTS, CHILDREN_OF, REPO_ROOT, REFERENCE_NPZ_PATH
+from blender_debug import clear_scene
+
+
+@dataclass
+class SMPLArmatureData:
+    """Bone layout as parallel arrays: row i of each array describes joint i."""
+    heads: np.ndarray    # (52, 3) float32 bone heads
+    tails: np.ndarray    # (52, 3) float32 bone tails
+    parents: np.ndarray  # (52,) int32 parent index, -1 for the root
+    names: List[str]
 
 
-# SMPL+H kinematic tree
-SMPL_H_PARENTS = np.array([
-    -1, 0, 0, 0, 1, 2, 3, 4, 5, 6,
-    7, 8, 9, 9, 9, 12, 13, 14, 16, 17,
-    18, 19, 20, 22, 23, 20, 25, 26, 20, 28,
-    29, 20, 31, 32, 20, 34, 35, 21, 37, 38,
-    21, 40, 41, 21, 43, 44, 21, 46, 47, 21,
-    49, 50,
-], dtype=np.int32)
+def build_armature_data(joint_positions: np.ndarray) -> SMPLArmatureData:
+    """Bone heads at the joints; each tail at its first child (Spine1 for the pelvis), or 5cm along Y+ for end bones."""
+    heads = np.ascontiguousarray(joint_positions, dtype=np.float32)
+    tails = heads + np.array([0.0, 0.05, 0.0], dtype=np.float32)
+    for i, children in enumerate(CHILDREN_OF):
+        if children:
+            tails[i] = heads[3 if i == 0 else children[0]]
+    return SMPLArmatureData(heads=heads, tails=tails, parents=SMPL_H_PARENTS, names=JOINT_NAMES)
+
 
-# Joint names
-JOINT_NAMES = [
-    "Pelvis", "L_Hip", "R_Hip", "Spine1", "L_Knee", "R_Knee", "Spine2", 
-    "L_Ankle", "R_Ankle", "Spine3", "L_Foot", "R_Foot", "Neck", 
-    "L_Collar", "R_Collar", "Head", "L_Shoulder", "R_Shoulder", 
-    "L_Elbow", "R_Elbow", "L_Wrist", "R_Wrist"
-] + [f"L_Hand_{i}" for i in range(15)] + [f"R_Hand_{i}" for i in range(15)]
+def create_edit_bones(armature_obj: bpy.types.Object, data: SMPLArmatureData) -> None:
+    """Create and parent one edit bone per joint. Call in edit mode."""
+    edit_bones = armature_obj.data.edit_bones
+    # Plain tuples assign straight to head/tail without building Vectors per bone
+    heads_t = [tuple(row) for row in data.heads.tolist()]
+    tails_t = [tuple(row) for row in data.tails.tolist()]
+    
+    # Only the parenting step needs the bone objects themselves
+    bone_list = []
+    for name, head, tail in zip(data.names, heads_t, tails_t):
+        bone = edit_bones.new(name)
+        bone.head = head
+        bone.tail = tail
+        bone_list.append(bone)
+    
+    for i, parent_idx in enumerate(data.parents.tolist()):
+        if parent_idx != -1:
+            bone_list[i].parent = bone_list[parent_idx]
 
 
 def add_cube_and_parent(armature_obj: bpy.types.Object, cube_size: float = 0.05, 
@@ -56,78 +84,96 @@ def add_cube_and_parent(armature_obj: bpy.types.Object, cube_size: float = 0.05,
     return cube
 
 
+# Rest-pose value of every keyed pose-bone channel
+REST_POSE_CHANNELS = (
+    ("rotation_quaternion", (1.0, 0.0, 0.0, 0.0)),  # Identity
+    ("location", (0.0, 0.0, 0.0)),  # No offset
+)
+
+# Keyframe.interpolation enum values as seen by foreach_set
+INTERPOLATION_CONSTANT = 0
+INTERPOLATION_LINEAR = 1
+
+
+def keyframe_rest_pose(armature_obj: bpy.types.Object, num_frames: int, dense: bool = False) -> None:
+    """Key every bone at rest over frames 0..num_frames-1 by writing fcurves directly.
+
+    The pose never changes, so unless dense is set only the first and last frame are
+    keyed with constant interpolation. Avoids a scene.frame_set + keyframe_insert
+    round-trip per bone per frame.
+    """
+    armature_obj.animation_data_create()
+    action = bpy.data.actions.new("Reference_APose_Action")
+    armature_obj.animation_data.action = action
+    
+    key_frames = np.arange(num_frames) if dense else np.unique([0, num_frames - 1])
+    num_keys = len(key_frames)
+    
+    # (num_keys, 2) [frame, value] buffer; only the value column changes per fcurve
+    keyframe_coords = np.empty((num_keys, 2), dtype=np.float32)
+    keyframe_coords[:, 0] = key_frames
+    interpolation = np.full(
+        num_keys, INTERPOLATION_LINEAR if dense else INTERPOLATION_CONSTANT, dtype=np.int32
+    )
+    for bone_name in JOINT_NAMES:
+        for data_path, rest_values in REST_POSE_CHANNELS:
+            for index, value in enumerate(rest_values):
+                fcurve = action.fcurves.new(
+                    data_path=f'pose.bones["{bone_name}"].{data_path}', index=index, action_group=bone_name
+                )
+                keyframe_coords[:, 1] = value
+                fcurve.keyframe_points.add(num_keys)
+                fcurve.keyframe_points.foreach_set("co", keyframe_coords.ravel())
+                fcurve.keyframe_points.foreach_set("interpolation", interpolation)
+                fcurve.update()
+
+
 def main():
     argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    dense = '--dense' in argv
+    argv = [arg for arg in argv if arg != '--dense']
     
     if len(argv) < 1:
-        print("Usage: blender --background --python convert_reference_to_glb.py -- <NUM_FRAMES> [OUTPUT_PATH]")
+        print("Usage: blender --background --python convert_reference_to_glb.py -- <NUM_FRAMES> [OUTPUT_PATH] [--dense]")
         print("Example: blender --background --python convert_reference_to_glb.py -- 10 data/reference/reference_apose_10frames.glb")
         return
     
     num_frames = int(argv[0])
-    output_path = Path(argv[1]) if len(argv) > 1 else Path(__file__).parent.parent.parent / 'data' / 'reference' / f'reference_apose_{num_frames}frames.glb'
+    output_path = Path(argv[1]) if len(argv) > 1 else REPO_ROOT / 'data' / 'reference' / f'reference_apose_{num_frames}frames.glb'
     
     # Load reference A-pose
-    ref_path = Path(__file__).parent.parent.parent / 'data' / 'reference' / 'smplh_target_reference.npz'
-    if not ref_path.exists():
-        print(f"Error: Reference NPZ not found at {ref_path}")
+    if not REFERENCE_NPZ_PATH.exists():
+        print(f"Error: Reference NPZ not found at {REFERENCE_NPZ_PATH}")
         return
     
-    ref_data = np.load(str(ref_path))
+    ref_data = np.load(str(REFERENCE_NPZ_PATH))
     J_ABSOLUTE = ref_data['J_ABSOLUTE']
     
     print(f"Loaded reference A-pose with {len(J_ABSOLUTE)} joints")
     print(f"Creating GLB with {num_frames} frames of the same A-pose")
     
     # Clear scene
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    for action in bpy.data.actions:
-        bpy.data.actions.remove(action)
-    for mesh in bpy.data.meshes:
-        bpy.data.meshes.remove(mesh)
-    for armature in bpy.data.armatures:
-        bpy.data.armatures.remove(armature)
+    clear_scene()
+    
+    # Resolve context members once instead of through RNA on every use
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
     
     # Create armature
     armature_data = bpy.data.armatures.new("SMPL_H_Armature")
     armature_obj = bpy.data.objects.new("SMPL_H_Armature", armature_data)
     bpy.context.collection.objects.link(armature_obj)
-    bpy.context.view_layer.objects.active = armature_obj
+    view_layer.objects.active = armature_obj
     
     # Create bones from reference positions
     bpy.ops.object.mode_set(mode='EDIT')
-    edit_bones = armature_obj.data.edit_bones
-    bone_list = []
-    
-    for i in range(52):
-        bone = edit_bones.new(JOINT_NAMES[i] if i < len(JOINT_NAMES) else f"Joint_{i}")
-        bone.head = Vector(J_ABSOLUTE[i])
-        
-        # Set tail pointing toward first child
-        children = [j for j in range(52) if SMPL_H_PARENTS[j] == i]
-        if children:
-            if i == 0:  # Pelvis
-                bone.tail = Vector(J_ABSOLUTE[3])  # Spine1
-            else:
-                bone.tail = Vector(J_ABSOLUTE[children[0]])
-        else:
-            # End bones - point in Y+ direction
-            bone.tail = Vector(J_ABSOLUTE[i]) + Vector((0, 0.05, 0))
-        
-        bone_list.append(bone)
-    
-    # Set parent relationships
-    for i in range(52):
-        parent_idx = int(SMPL_H_PARENTS[i])
-        if parent_idx != -1:
-            bone_list[i].parent = bone_list[parent_idx]
+    create_edit_bones(armature_obj, build_armature_data(J_ABSOLUTE))
     
     bpy.ops.object.mode_set(mode='OBJECT')
     
     # Set frame range
-    bpy.context.scene.frame_start = 0
-    bpy.context.scene.frame_end = num_frames - 1
+    scene.frame_start = 0
+    scene.frame_end = num_frames - 1
     
     # Set armature display
     armature_obj.show_in_front = True
@@ -139,21 +185,7 @@ def main():
     
     # Set all bones to rest pose (identity rotations) for all frames
     print("Setting all frames to A-pose (rest pose = identity rotations)...")
-    bpy.context.view_layer.objects.active = armature_obj
-    armature_obj.select_set(True)
-    bpy.ops.object.mode_set(mode='POSE')
-    
-    for frame in range(num_frames):
-        bpy.context.scene.frame_set(frame)
-        for bone_name in JOINT_NAMES:
-            pose_bone = armature_obj.pose.bones.get(bone_name)
-            if pose_bone:
-                pose_bone.rotation_quaternion = (1, 0, 0, 0)  # Identity
-                pose_bone.location = (0, 0, 0)  # No offset
-                pose_bone.keyframe_insert(data_path="rotation_quaternion", frame=frame)
-                pose_bone.keyframe_insert(data_path="location", frame=frame)
-    
-    bpy.ops.object.mode_set(mode='OBJECT')
+    keyframe_rest_pose(armature_obj, num_frames, dense=dense)
     
     print(f"✓ Set {num_frames} frames to A-pose")
     
@@ -169,6 +201,12 @@ def main():
         use_selection=True,
         export_animations=True,
         export_skins=True,
+        # Write the keys we set instead of resampling every bone on every frame
+        export_frame_range=True,
+        export_anim_single_armature=True,
+        export_force_sampling=False,
+        export_optimize_animation_size=True,
+        export_optimize_animation_keep_anim_armature=False,
     )
     
     print(f"✓ Successfully exported to: {output_path}")
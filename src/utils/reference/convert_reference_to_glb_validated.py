@@ -68,10 +68,12 @@ def main():
         return
     
     num_frames = int(argv[0])
-    output_path = Path(argv[1]) if len(argv) > 1 else Path(__file__).parent.parent.parent / 'data' / 'reference' / f'reference_apose_{num_frames}frames.glb'
+    # src/utils/reference/<script>.py -> repository root
+    reference_dir = Path(__file__).resolve().parents[3] / 'data' / 'reference'
+    output_path = Path(argv[1]) if len(argv) > 1 else reference_dir / f'reference_apose_{num_frames}frames.glb'
     
     # Load reference A-pose
-    ref_path = Path(__file__).parent.parent.parent / 'data' / 'reference' / 'smplh_target_reference.npz'
+    ref_path = reference_dir / 'smplh_target_reference.npz'
     if not ref_path.exists():
         print(f"Error: Reference NPZ not found at {ref_path}")
         return
@@ -54,11 +54,8 @@ JOINT_NAMES = [
 
 
 def find_armature() -> Optional[bpy.types.Object]:
-    """Find the first armature object in the scene."""
-    for obj in bpy.context.scene.objects:
-        if obj.type == 'ARMATURE':
-            return obj
-    return None
+    """Find the first armature object in the scene (one pass, stops at the first match)."""
+    return next((obj for obj in bpy.context.scene.objects if obj.type == 'ARMATURE'), None)
 
 
 def extract_j_absolute_from_rest_pose(armature_obj: bpy.types.Object) -> np.ndarray:
@@ -66,25 +63,26 @@ def extract_j_absolute_from_rest_pose(armature_obj: bpy.types.Object) -> np.ndar
     Extract J_ABSOLUTE from armature rest pose (edit_bones).
     This gives the rest pose positions, not the posed positions.
     """
-    bpy.context.view_layer.objects.active = armature_obj
-    bpy.ops.object.mode_set(mode='EDIT')
-    
-    edit_bones = armature_obj.data.edit_bones
-    J_ABSOLUTE = np.zeros((52, 3), dtype=np.float64)
+    # Rest heads in armature space are also on the data bones (head_local, same as
+    # edit_bones heads), so read them all in one call without entering EDIT mode
+    bones = armature_obj.data.bones
+    all_heads = np.empty(len(bones) * 3, dtype=np.float32)
+    bones.foreach_get('head_local', all_heads)
+    index_by_name = {b.name: i for i, b in enumerate(bones)}
     
-    for i, joint_name in enumerate(JOINT_NAMES):
-        if joint_name not in edit_bones:
+    for joint_name in JOINT_NAMES:
+        if joint_name not in index_by_name:
             raise KeyError(f"Bone '{joint_name}' not found in armature")
-        
-        bone = edit_bones[joint_name]
-        head_local = bone.head.to_4d()
-        head_world = armature_obj.matrix_world @ head_local
-        J_ABSOLUTE[i] = np.array([head_world.x, head_world.y, head_world.z], dtype=np.float64)
-        if joint_name == "Pelvis":
-            tail_world = armature_obj.matrix_world @ bone.tail.to_4d()
-            print(f"[REST] Pelvis head: {J_ABSOLUTE[i]}, tail: {[tail_world.x, tail_world.y, tail_world.z]}")
+    heads = all_heads.reshape(-1, 3)[[index_by_name[name] for name in JOINT_NAMES]]
+    
+    # Armature -> world for all 52 heads in one matmul
+    matrix_world = np.array(armature_obj.matrix_world)
+    J_ABSOLUTE = heads @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+    
+    pelvis = bones[JOINT_NAMES[0]]
+    tail_world = armature_obj.matrix_world @ pelvis.tail_local
+    print(f"[REST] Pelvis head: {J_ABSOLUTE[0]}, tail: {[tail_world.x, tail_world.y, tail_world.z]}")
     
-    bpy.ops.object.mode_set(mode='OBJECT')
     return J_ABSOLUTE
 
 
@@ -96,31 +94,36 @@ def extract_j_absolute_and_rotations_from_posed(armature_obj: bpy.types.Object)
     bpy.context.view_layer.objects.active = armature_obj
     bpy.ops.object.mode_set(mode='POSE')
 
-    # Get armature world matrix
-    armature_matrix = armature_obj.matrix_world
-
-    J_ABSOLUTE = np.zeros((52, 3), dtype=np.float64)
-    pose_rotations = {}  # Dictionary mapping joint names to quaternions
     pose_bones = armature_obj.pose.bones
 
-    # Extract positions and rotations
+    # All local rotation quaternions in one bulk read (pose bone order)
+    all_quats = np.empty(len(pose_bones) * 4, dtype=np.float64)
+    pose_bones.foreach_get('rotation_quaternion', all_quats)
+    all_quats = all_quats.reshape(-1, 4)
+    index_by_name = {b.name: i for i, b in enumerate(pose_bones)}
+
+    # Gather pose matrices and rest heads (missing bones are caught here, before the rotation lookup)
+    pose_matrices = np.empty((52, 4, 4), dtype=np.float64)
+    heads_local = np.ones((52, 4), dtype=np.float64)
     for i, joint_name in enumerate(JOINT_NAMES):
-        if joint_name not in pose_bones:
+        idx = index_by_name.get(joint_name)
+        if idx is None:
             raise KeyError(f"Bone '{joint_name}' not found in armature")
 
-        pose_bone = pose_bones[joint_name]
+        pose_bone = pose_bones[idx]
+        pose_matrices[i] = pose_bone.matrix
+        heads_local[i, :3] = pose_bone.bone.head_local
+
+    # head_world = matrix_world @ pose_matrix @ head for all joints in one pass
+    matrix_world = np.array(armature_obj.matrix_world)
+    J_ABSOLUTE = np.einsum('ij,njk,nk->ni', matrix_world, pose_matrices, heads_local)[:, :3]
+
+    pelvis = pose_bones[index_by_name[JOINT_NAMES[0]]]
+    tail_world = armature_obj.matrix_world @ (pelvis.matrix @ Vector(pelvis.bone.tail_local).to_4d())
+    print(f"[POSED] Pelvis head: {J_ABSOLUTE[0]}, tail: {[tail_world.x, tail_world.y, tail_world.z]}")
 
-        head_local = Vector(pose_bone.bone.head_local).to_4d()
-        head_world = armature_matrix @ (pose_bone.matrix @ head_local)
-        J_ABSOLUTE[i] = np.array([head_world.x, head_world.y, head_world.z], dtype=np.float64)
-        if joint_name == "Pelvis":
-            tail_local = Vector(pose_bone.bone.tail_local).to_4d()
-            tail_world = armature_matrix @ (pose_bone.matrix @ tail_local)
-            print(f"[POSED] Pelvis head: {J_ABSOLUTE[i]}, tail: {[tail_world.x, tail_world.y, tail_world.z]}")
-        
-        # Extract rotation quaternion (local rotation)
-        quat = pose_bone.rotation_quaternion
-        pose_rotations[joint_name] = np.array([quat.w, quat.x, quat.y, quat.z], dtype=np.float64)
+    # Dictionary mapping joint names to quaternions [w, x, y, z]
+    pose_rotations = {name: all_quats[index_by_name[name]] for name in JOINT_NAMES}
 
     bpy.ops.object.mode_set(mode='OBJECT')
     return J_ABSOLUTE, pose_rotations
@@ -137,16 +140,12 @@ def extract_j_absolute_from_posed(armature_obj: bpy.types.Object) -> np.ndarray:
 
 def compute_smpl_offsets(J_ABSOLUTE: np.ndarray) -> np.ndarray:
     """Compute SMPL_OFFSETS from J_ABSOLUTE using parent tree."""
-    SMPL_OFFSETS = np.zeros((52, 3), dtype=np.float64)
+    # Child joints - offset is relative to parent (root gathers itself for now)
+    is_root = SMPL_H_PARENTS == -1
+    SMPL_OFFSETS = J_ABSOLUTE - J_ABSOLUTE[np.where(is_root, 0, SMPL_H_PARENTS)]
     
-    for i in range(52):
-        parent_idx = int(SMPL_H_PARENTS[i])
-        if parent_idx == -1:
-            # Root joint - offset is just its position
-            SMPL_OFFSETS[i] = J_ABSOLUTE[i]
-        else:
-            # Child joint - offset is relative to parent
-            SMPL_OFFSETS[i] = J_ABSOLUTE[i] - J_ABSOLUTE[parent_idx]
+    # Root joint - offset is just its position
+    SMPL_OFFSETS[is_root] = J_ABSOLUTE[is_root]
     
     return SMPL_OFFSETS
 
@@ -183,8 +182,8 @@ def main():
     
     print(f"✓ Extracted J_ABSOLUTE: shape {J_ABSOLUTE.shape}")
     print("=== J_ABSOLUTE (world space) ===")
-    for idx, name in enumerate(JOINT_NAMES):
-        print(f"{idx:02d} {name:15s}: {J_ABSOLUTE[idx]}")
+    # One write for the whole table instead of a print (and flush) per joint
+    print("\n".join(f"{idx:02d} {name:15s}: {J_ABSOLUTE[idx]}" for idx, name in enumerate(JOINT_NAMES)))
     print(f"✓ Computed SMPL_OFFSETS: shape {SMPL_OFFSETS.shape}")
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
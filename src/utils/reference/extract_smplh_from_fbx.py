@@ -27,25 +27,11 @@ import json
 import numpy as np
 import sys
 from pathlib import Path
-from typing import Dict, List
-from mathutils import Vector
+from typing import Dict
 
-
-JOINT_NAMES: List[str] = [
-    "Pelvis","L_Hip","R_Hip","Spine1","L_Knee","R_Knee","Spine2",
-    "L_Ankle","R_Ankle","Spine3","L_Foot","R_Foot","Neck",
-    "L_Collar","R_Collar","Head","L_Shoulder","R_Shoulder",
-    "L_Elbow","R_Elbow","L_Wrist","R_Wrist",
-] + [f"L_Hand_{i}" for i in range(15)] + [f"R_Hand_{i}" for i in range(15)]
-
-SMPL_H_PARENTS = np.array([
-    -1, 0, 0, 0, 1, 2, 3, 4, 5, 6,
-    7, 8, 9, 9, 9, 12, 13, 14, 16, 17,
-    18, 19, 20, 22, 23, 20, 25, 26, 20, 28,
-    29, 20, 31, 32, 20, 34, 35, 21, 37, 38,
-    21, 40, 41, 21, 43, 44, 21, 46, 47, 21,
-    49, 50,
-], dtype=np.int32)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from smpl_constants import JOINT_NAMES, SMPL_H_PARENTS_LIST, CHILDREN_OF, ROOT_MASK, PARENTS_SAFE
+from blender_debug import clear_scene
 
 
 def find_armature():
@@ -59,38 +45,39 @@ def load_mapping(mapping_path: Path) -> Dict[str, str]:
     with mapping_path.open() as f:
         m = json.load(f)
     # Basic validation
-    missing = [k for k in JOINT_NAMES if k not in m or not m[k]]
+    mapped = {k for k, v in m.items() if v}
+    missing = [k for k in JOINT_NAMES if k not in mapped]
     if missing:
         raise ValueError(f"Mapping missing entries for: {missing[:5]}{'...' if len(missing)>5 else ''}")
     return m
 
 
 def extract_joints_from_fbx(armature_obj, mapping: Dict[str, str]) -> np.ndarray:
-    # Ensure edit mode to access edit_bones heads/tails in armature space
-    bpy.context.view_layer.objects.active = armature_obj
-    bpy.ops.object.mode_set(mode='EDIT')
-    edit_bones = armature_obj.data.edit_bones
-    heads = np.zeros((52, 3), dtype=np.float64)
-    for i, smpl_name in enumerate(JOINT_NAMES):
+    # Rest-pose heads in armature space are on the data bones as head_local (same
+    # as edit_bones heads), so one bulk read in OBJECT mode replaces EDIT mode
+    bones = armature_obj.data.bones
+    all_heads = np.empty(len(bones) * 3, dtype=np.float32)
+    bones.foreach_get('head_local', all_heads)
+    all_heads = all_heads.reshape(-1, 3)
+    # Name lookups on the bone collection scan it; hash the names once instead
+    index_by_name = {b.name: i for i, b in enumerate(bones)}
+    bone_indices = []
+    for smpl_name in JOINT_NAMES:
         fbx_name = mapping[smpl_name]
-        if fbx_name not in edit_bones:
+        idx = index_by_name.get(fbx_name)
+        if idx is None:
             raise KeyError(f"FBX bone not found for {smpl_name}: '{fbx_name}'")
-        head = edit_bones[fbx_name].head
-        # FBX coordinate conversion: no transform needed, use as-is
-        # (Blender FBX import handles coordinate system automatically)
-        heads[i] = np.array([head.x, head.y, head.z], dtype=np.float64)
-    bpy.ops.object.mode_set(mode='OBJECT')
+        bone_indices.append(idx)
+    # FBX coordinate conversion: no transform needed, use as-is
+    # (Blender FBX import handles coordinate system automatically)
+    # Kept as float32: that's Blender's own precision, so float64 adds nothing
+    heads = all_heads[bone_indices]
     return heads
 
 
 def build_offsets(J_abs: np.ndarray) -> np.ndarray:
-    offsets = np.zeros_like(J_abs)
-    for i in range(52):
-        p = int(SMPL_H_PARENTS[i])
-        if p == -1:
-            offsets[i] = J_abs[i]
-        else:
-            offsets[i] = J_abs[i] - J_abs[p]
+    offsets = J_abs - J_abs[PARENTS_SAFE]
+    offsets[ROOT_MASK] = J_abs[ROOT_MASK]
     return offsets
 
 
@@ -105,19 +92,21 @@ def create_smplh_armature(J_abs: np.ndarray, name: str = "SMPLH_Target"):
     edit_bones = armature.edit_bones
     for i, jn in enumerate(JOINT_NAMES):
         b = edit_bones.new(jn)
-        b.head = Vector(J_abs[i])
+        # Blender takes plain sequences for head/tail; no Vector temporaries needed
+        x, y, z = J_abs[i].tolist()
+        b.head = (x, y, z)
         # Tail toward first child or small stub
-        children = [c for c in range(52) if SMPL_H_PARENTS[c] == i]
+        children = CHILDREN_OF[i]
         if children:
             child = children[0]
-            b.tail = Vector(J_abs[child])
+            b.tail = J_abs[child].tolist()
         else:
-            b.tail = Vector(J_abs[i]) + Vector((0, 0.05, 0))
+            b.tail = (x, y + 0.05, z)
     # Parents
     bone_list = list(edit_bones)
-    for i, p in enumerate(SMPL_H_PARENTS):
+    for i, p in enumerate(SMPL_H_PARENTS_LIST):
         if p != -1:
-            bone_list[i].parent = bone_list[int(p)]
+            bone_list[i].parent = bone_list[p]
     bpy.ops.object.mode_set(mode='OBJECT')
     return armature_obj
 
@@ -126,11 +115,9 @@ def add_cube_and_parent(armature_obj):
     bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0.0, 0.0, 0.0))
     cube = bpy.context.active_object
     cube.name = "ParentedCube"
-    bpy.ops.object.select_all(action='DESELECT')
-    cube.select_set(True)
-    armature_obj.select_set(True)
-    bpy.context.view_layer.objects.active = armature_obj
-    bpy.ops.object.parent_set(type='OBJECT', keep_transform=True)
+    # Same result as parent_set(keep_transform=True), without the operator
+    cube.parent = armature_obj
+    cube.matrix_parent_inverse = armature_obj.matrix_world.inverted()
     return cube
 
 
@@ -146,8 +133,7 @@ def main():
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # Reset scene
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    clear_scene()
 
     # Import FBX
     bpy.ops.import_scene.fbx(filepath=str(fbx_path))
@@ -166,8 +152,7 @@ def main():
 
     # Build armature and export GLB
     # Reset scene for a clean export
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    clear_scene()
     arm2 = create_smplh_armature(J_abs)
     cube = add_cube_and_parent(arm2)
     bpy.ops.object.select_all(action='DESELECT')
@@ -7,17 +7,13 @@ This gives identity rotations for most bones, with only shoulders modified.
 """
 
 import numpy as np
+import sys
 from pathlib import Path
-from mathutils import Quaternion, Euler
 import math
 
-# Joint names
-JOINT_NAMES = [
-    "Pelvis", "L_Hip", "R_Hip", "Spine1", "L_Knee", "R_Knee", "Spine2",
-    "L_Ankle", "R_Ankle", "Spine3", "L_Foot", "R_Foot", "Neck",
-    "L_Collar", "R_Collar", "Head", "L_Shoulder", "R_Shoulder",
-    "L_Elbow", "R_Elbow", "L_Wrist", "R_Wrist"
-] + [f"L_Hand_{i}" for i in range(15)] + [f"R_Hand_{i}" for i in range(15)]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from smpl_constants import JOINT_NAMES, REPO_ROOT
+from npz_io import save_apose_rotations
 
 
 def create_apose_rotations() -> dict:
@@ -41,22 +37,18 @@ def create_apose_rotations() -> dict:
     for bone_name in JOINT_NAMES:
         rotations[bone_name] = identity_quat.copy()
     
+    # Axis-angle about Y is (cos(θ/2), 0, sin(θ/2), 0); no mathutils needed
+    half_angle = math.radians(45) / 2
+    c, s = math.cos(half_angle), math.sin(half_angle)
+
     # L_Shoulder: rotate down 45° around Y-axis (local rotation)
     # In Blender: R Y -45
-    angle = math.radians(-45)
-    l_shoulder_quat = Quaternion((0, 1, 0), angle)  # Axis-angle to quaternion
-    rotations["L_Shoulder"] = np.array([
-        l_shoulder_quat.w, l_shoulder_quat.x, l_shoulder_quat.y, l_shoulder_quat.z
-    ], dtype=np.float64)
-    
+    rotations["L_Shoulder"] = np.array([c, 0.0, -s, 0.0], dtype=np.float64)
+
     # R_Shoulder: rotate down 45° around Y-axis (opposite direction)
     # In Blender: R Y 45
-    angle = math.radians(45)
-    r_shoulder_quat = Quaternion((0, 1, 0), angle)
-    rotations["R_Shoulder"] = np.array([
-        r_shoulder_quat.w, r_shoulder_quat.x, r_shoulder_quat.y, r_shoulder_quat.z
-    ], dtype=np.float64)
-    
+    rotations["R_Shoulder"] = np.array([c, 0.0, s, 0.0], dtype=np.float64)
+
     return rotations
 
 
@@ -67,11 +59,10 @@ def main():
     rotations = create_apose_rotations()
     
     # Output path
-    output_path = Path(__file__).parent.parent.parent / "data" / "reference" / "apose_rotations.npz"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path = REPO_ROOT / "data" / "reference" / "apose_rotations.npz"
     
     # Save to NPZ
-    np.savez(output_path, **rotations)
+    save_apose_rotations(rotations, output_path)
     
     print(f"✓ Generated {len(rotations)} bone rotations")
     print(f"✓ Saved to: {output_path}")
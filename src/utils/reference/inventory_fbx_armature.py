@@ -24,9 +24,13 @@ EXAMPLE:
 """
 import bpy
 import csv
+import numpy as np
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from blender_debug import clear_scene
+
 
 def find_armature():
     for obj in bpy.context.scene.objects:
@@ -37,24 +41,34 @@ def find_armature():
 
 def export_bones_csv(armature_obj, out_csv: Path):
     bones = armature_obj.data.bones
-    rows = [["bone_name", "parent", "length", "num_children", "is_end"]]
+    num_bones = len(bones)
 
-    name_to_children = {b.name: [] for b in bones}
-    for b in bones:
-        if b.parent:
-            name_to_children[b.parent.name].append(b.name)
+    # Rest heads/tails in two bulk reads, then every bone length in one pass
+    heads = np.empty(num_bones * 3, dtype=np.float32)
+    tails = np.empty(num_bones * 3, dtype=np.float32)
+    bones.foreach_get('head_local', heads)
+    bones.foreach_get('tail_local', tails)
+    lengths = np.linalg.norm((tails - heads).reshape(num_bones, 3).astype(np.float64), axis=1).tolist()
 
+    num_children = {b.name: 0 for b in bones}
     for b in bones:
-        parent = b.parent.name if b.parent else ""
-        length = (b.tail_local - b.head_local).length
-        num_children = len(name_to_children[b.name])
-        is_end = 1 if num_children == 0 else 0
-        rows.append([b.name, parent, f"{length:.6f}", num_children, is_end])
+        if b.parent:
+            num_children[b.parent.name] += 1
 
     out_csv.parent.mkdir(parents=True, exist_ok=True)
     with out_csv.open('w', newline='') as f:
         writer = csv.writer(f)
-        writer.writerows(rows)
+        writer.writerow(["bone_name", "parent", "length", "num_children", "is_end"])
+        writer.writerows(
+            [
+                b.name,
+                b.parent.name if b.parent else "",
+                f"{length:.6f}",
+                num_children[b.name],
+                1 if num_children[b.name] == 0 else 0,
+            ]
+            for b, length in zip(bones, lengths)
+        )
 
 
 def main():
@@ -67,8 +81,7 @@ def main():
     out_csv = Path(argv[1])
 
     # Reset scene
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    clear_scene()
 
     # Import FBX
     bpy.ops.import_scene.fbx(filepath=str(fbx_path))
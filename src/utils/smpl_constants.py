@@ -0,0 +1,89 @@
+"""
+============================================================================
+SMPL-H SKELETON CONSTANTS
+============================================================================
+
+PURPOSE:
+    Shared SMPL-H joint names, kinematic tree, T-pose joint positions and a
+    precomputed children table for the utility scripts, so each script
+    doesn't redeclare them. Also the repository root and reference NPZ path,
+    so scripts in any src/utils/ subdirectory resolve data/ the same way.
+
+USAGE:
+    Scripts under src/utils/ add src/utils to sys.path and import from here:
+
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from smpl_constants import JOINT_NAMES, SMPL_H_PARENTS, CHILDREN_OF
+============================================================================
+"""
+import numpy as np
+from pathlib import Path
+from typing import List
+from numpy.typing import NDArray
+
+
+# This file lives in src/utils/, so the repository root is two levels up
+REPO_ROOT: Path = Path(__file__).resolve().parents[2]
+REFERENCE_NPZ_PATH: Path = REPO_ROOT / 'data' / 'reference' / 'smplh_target_reference.npz'
+
+# SMPL+H kinematic tree
+SMPL_H_PARENTS: NDArray[np.int32] = np.array([
+    -1, 0, 0, 0, 1, 2, 3, 4, 5, 6,
+    7, 8, 9, 9, 9, 12, 13, 14, 16, 17,
+    18, 19, 20, 22, 23, 20, 25, 26, 20, 28,
+    29, 20, 31, 32, 20, 34, 35, 21, 37, 38,
+    21, 40, 41, 21, 43, 44, 21, 46, 47, 21,
+    49, 50,
+], dtype=np.int32)
+
+# Same tree as plain Python ints, for per-joint loops (no NumPy scalar boxing)
+SMPL_H_PARENTS_LIST: List[int] = SMPL_H_PARENTS.tolist()
+
+# Root mask and parent index per joint with the root pointed at itself, for
+# gather-style parent lookups (e.g. offsets = J - J[PARENTS_SAFE])
+ROOT_MASK: NDArray[np.bool_] = SMPL_H_PARENTS == -1
+PARENTS_SAFE: NDArray[np.int32] = np.where(ROOT_MASK, 0, SMPL_H_PARENTS).astype(np.int32)
+
+# Joint names
+JOINT_NAMES: List[str] = [
+    "Pelvis", "L_Hip", "R_Hip", "Spine1", "L_Knee", "R_Knee", "Spine2",
+    "L_Ankle", "R_Ankle", "Spine3", "L_Foot", "R_Foot", "Neck",
+    "L_Collar", "R_Collar", "Head", "L_Shoulder", "R_Shoulder",
+    "L_Elbow", "R_Elbow", "L_Wrist", "R_Wrist"
+] + [f"L_Hand_{i}" for i in range(15)] + [f"R_Hand_{i}" for i in range(15)]
+
+# T-pose joint positions from the original SMPL-H template (same as retarget.py)
+J_ABSOLUTE_TPOSE: NDArray[np.float64] = np.array([
+    [-0.001795, -0.223333, 0.028219], [0.067725, -0.314740, 0.021404],
+    [-0.069466, -0.313855, 0.023899], [-0.004328, -0.114370, 0.001523],
+    [0.102001, -0.689938, 0.016908], [-0.107756, -0.696424, 0.015049],
+    [0.001159, 0.020810, 0.002615], [0.088406, -1.087899, -0.026785],
+    [-0.091982, -1.094839, -0.027263], [0.002616, 0.073732, 0.028040],
+    [0.114764, -1.143690, 0.092503], [-0.117354, -1.142983, 0.096085],
+    [-0.000162, 0.287603, -0.014817], [0.081461, 0.195482, -0.006050],
+    [-0.079143, 0.192565, -0.010575], [0.004990, 0.352572, 0.036532],
+    [0.172438, 0.225951, -0.014918], [-0.175155, 0.225116, -0.019719],
+    [0.432050, 0.213179, -0.042374], [-0.428897, 0.211787, -0.041119],
+    [0.681284, 0.222165, -0.043545], [-0.684196, 0.219560, -0.046679],
+    [0.783767, 0.213183, -0.022054], [0.815568, 0.216115, -0.018788],
+    [0.837963, 0.214387, -0.018140], [0.791063, 0.216050, -0.044867],
+    [0.821578, 0.217270, -0.048936], [0.845128, 0.215785, -0.052425],
+    [0.765890, 0.208316, -0.084165], [0.781693, 0.207917, -0.094992],
+    [0.797572, 0.206667, -0.105123], [0.779095, 0.213415, -0.067855],
+    [0.806930, 0.215059, -0.072228], [0.829592, 0.213672, -0.078705],
+    [0.723217, 0.202218, -0.017008], [0.740918, 0.203986, 0.007192],
+    [0.762150, 0.200379, 0.022060], [-0.783494, 0.210911, -0.022044],
+    [-0.815675, 0.213810, -0.019676], [-0.837971, 0.212032, -0.020059],
+    [-0.791352, 0.214082, -0.045896], [-0.821700, 0.215536, -0.050057],
+    [-0.844837, 0.214110, -0.053971], [-0.767226, 0.205917, -0.086044],
+    [-0.782858, 0.205594, -0.097170], [-0.798573, 0.204555, -0.107284],
+    [-0.779985, 0.211294, -0.069581], [-0.807581, 0.213016, -0.074152],
+    [-0.829999, 0.211622, -0.081116], [-0.722013, 0.199415, -0.016553],
+    [-0.739452, 0.200249, 0.007932], [-0.760794, 0.195263, 0.022366],
+])
+
+# Children of each joint in ascending index order, built in one pass over the parents
+CHILDREN_OF: List[List[int]] = [[] for _ in range(len(SMPL_H_PARENTS))]
+for _joint, _parent in enumerate(SMPL_H_PARENTS_LIST):
+    if _parent >= 0:
+        CHILDREN_OF[_parent].append(_joint)
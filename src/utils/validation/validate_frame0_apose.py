@@ -27,14 +27,9 @@ import sys
 from pathlib import Path
 from mathutils import Vector
 
-
-# SMPL+H Joint Names
-JOINT_NAMES = [
-    "Pelvis", "L_Hip", "R_Hip", "Spine1", "L_Knee", "R_Knee", "Spine2", 
-    "L_Ankle", "R_Ankle", "Spine3", "L_Foot", "R_Foot", "Neck", 
-    "L_Collar", "R_Collar", "Head", "L_Shoulder", "R_Shoulder", 
-    "L_Elbow", "R_Elbow", "L_Wrist", "R_Wrist"
-] + [f"L_Hand_{i}" for i in range(15)] + [f"R_Hand_{i}" for i in range(15)]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from smpl_constants import JOINT_NAMES, REFERENCE_NPZ_PATH
+from blender_debug import import_glb_and_get_armature
 
 
 def extract_frame0_joint_positions(glb_path: Path) -> np.ndarray:
@@ -44,78 +39,45 @@ def extract_frame0_joint_positions(glb_path: Path) -> np.ndarray:
     Returns:
         (52, 3) array of joint positions in armature local space
     """
-    # Clear scene
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    for action in bpy.data.actions:
-        bpy.data.actions.remove(action)
-    for mesh in bpy.data.meshes:
-        bpy.data.meshes.remove(mesh)
-    for armature in bpy.data.armatures:
-        bpy.data.armatures.remove(armature)
-    
-    # Import GLB
-    bpy.ops.import_scene.gltf(filepath=str(glb_path))
-    
-    # Find armature
-    armature_obj = next((obj for obj in bpy.context.scene.objects if obj.type == 'ARMATURE'), None)
-    if not armature_obj:
-        raise RuntimeError(f"No armature found in {glb_path}")
+    armature_obj, pose_bones, data_bones = import_glb_and_get_armature(glb_path)
     
     # Set to frame 0
     bpy.context.scene.frame_set(0)
     
     # Extract joint positions
-    # First, get rest pose positions from edit bones (armature local space)
-    bpy.context.view_layer.objects.active = armature_obj
-    bpy.ops.object.mode_set(mode='EDIT')
-    edit_bones = armature_obj.data.edit_bones
-    rest_positions = {}
-    for joint_name in JOINT_NAMES:
-        edit_bone = edit_bones.get(joint_name)
-        if edit_bone:
-            rest_positions[joint_name] = np.array([edit_bone.head.x, edit_bone.head.y, edit_bone.head.z])
-    
-    # Now check pose bones to see if we're at rest pose or need to use pose transform
-    bpy.ops.object.mode_set(mode='POSE')
-    pose_bones = armature_obj.pose.bones
     joint_positions = np.zeros((len(JOINT_NAMES), 3))
     
     # Check if all bones are at identity (rest pose)
-    all_identity = True
-    for pose_bone in pose_bones:
-        quat = pose_bone.rotation_quaternion
-        is_identity = abs(quat.w - 1.0) < 1e-6 and abs(quat.x) < 1e-6 and abs(quat.y) < 1e-6 and abs(quat.z) < 1e-6
-        is_no_offset = np.allclose(pose_bone.location, [0, 0, 0], atol=1e-6)
-        if not (is_identity and is_no_offset):
-            all_identity = False
-            break
+    # Bulk-read every quaternion and location, then test them in one go
+    all_pose_bones = armature_obj.pose.bones
+    quats = np.empty(len(all_pose_bones) * 4)
+    locations = np.empty(len(all_pose_bones) * 3)
+    all_pose_bones.foreach_get('rotation_quaternion', quats)
+    all_pose_bones.foreach_get('location', locations)
+    is_identity = np.abs(quats.reshape(-1, 4) - (1.0, 0.0, 0.0, 0.0)) < 1e-6
+    is_no_offset = np.abs(locations) <= 1e-6
+    all_identity = bool(is_identity.all() and is_no_offset.all())
     
     if all_identity:
-        # All bones at rest pose, use edit bone positions (already in armature local space)
-        for i, joint_name in enumerate(JOINT_NAMES):
-            if joint_name in rest_positions:
-                joint_positions[i] = rest_positions[joint_name]
+        # All bones at rest pose, use rest head positions (already in armature local space)
+        for i, bone in enumerate(data_bones):
+            if bone:
+                joint_positions[i] = bone.head_local
     else:
         # Need to use pose transforms
-        for i, joint_name in enumerate(JOINT_NAMES):
-            pose_bone = pose_bones.get(joint_name)
+        for i, pose_bone in enumerate(pose_bones):
             if pose_bone:
-                bone = pose_bone.bone
-                # pose_bone.matrix gives transform in armature local space
-                pose_head = pose_bone.matrix @ bone.head
-                joint_positions[i] = np.array([pose_head.x, pose_head.y, pose_head.z])
+                # pose_bone.head is the posed head position in armature local space
+                joint_positions[i] = pose_bone.head
     
-    bpy.ops.object.mode_set(mode='OBJECT')
     return joint_positions
 
 
 def load_reference_positions() -> np.ndarray:
     """Load reference A-pose joint positions from NPZ."""
-    ref_path = Path(__file__).parent.parent.parent / 'data' / 'reference' / 'smplh_target_reference.npz'
-    if not ref_path.exists():
-        raise FileNotFoundError(f"Reference NPZ not found at {ref_path}")
-    ref = np.load(str(ref_path))
+    if not REFERENCE_NPZ_PATH.exists():
+        raise FileNotFoundError(f"Reference NPZ not found at {REFERENCE_NPZ_PATH}")
+    ref = np.load(str(REFERENCE_NPZ_PATH))
     return ref['J_ABSOLUTE']
 
 
@@ -113,7 +113,8 @@ def extract_frame0_joint_positions(glb_path: Path) -> np.ndarray:
 
 def load_reference_positions() -> np.ndarray:
     """Load reference A-pose joint positions from NPZ."""
-    ref_path = Path(__file__).parent.parent.parent / 'data' / 'reference' / 'smplh_target_reference.npz'
+    # src/utils/validation/<script>.py -> repository root
+    ref_path = Path(__file__).resolve().parents[3] / 'data' / 'reference' / 'smplh_target_reference.npz'
     if not ref_path.exists():
         raise FileNotFoundError(f"Reference NPZ not found at {ref_path}")
     ref = np.load(str(ref_path))
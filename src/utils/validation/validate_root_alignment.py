@@ -28,11 +28,14 @@ from pathlib import Path
 from mathutils import Vector
 from typing import Tuple, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from smpl_constants import REFERENCE_NPZ_PATH
+from blender_debug import import_glb_and_get_armature
+
 
 def load_reference_pelvis() -> np.ndarray:
     """Load reference pelvis position from smplh_target_reference.npz."""
-    ref_path = Path(__file__).parent.parent.parent / 'data' / 'reference' / 'smplh_target_reference.npz'
-    ref = np.load(str(ref_path))
+    ref = np.load(str(REFERENCE_NPZ_PATH))
     J_ABSOLUTE = ref['J_ABSOLUTE']
     return J_ABSOLUTE[0]  # Pelvis is index 0
 
@@ -44,42 +47,23 @@ def get_pelvis_position_from_glb(glb_path: Path) -> Optional[np.ndarray]:
     Returns:
         Pelvis position as (3,) array, or None if not found
     """
-    # Clear scene
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    
-    # Import GLB
-    bpy.ops.import_scene.gltf(filepath=str(glb_path))
-    
-    # Find armature
-    armature_obj = None
-    for obj in bpy.context.scene.objects:
-        if obj.type == 'ARMATURE':
-            armature_obj = obj
-            break
-    
-    if not armature_obj:
+    try:
+        armature_obj, pose_bones, _ = import_glb_and_get_armature(glb_path)
+    except RuntimeError:
         print(f"⚠️  No armature found in {glb_path.name}")
         return None
     
     # Set to frame 0
     bpy.context.scene.frame_set(0)
     
-    # Get pelvis bone in pose mode
-    bpy.context.view_layer.objects.active = armature_obj
-    bpy.ops.object.mode_set(mode='POSE')
-    
-    pelvis_bone = armature_obj.pose.bones.get('Pelvis')
+    pelvis_bone = pose_bones[0]  # Pelvis is index 0
     if not pelvis_bone:
         print(f"⚠️  Pelvis bone not found in {glb_path.name}")
-        bpy.ops.object.mode_set(mode='OBJECT')
         return None
     
     # Get world-space head position
     pelvis_world_pos = armature_obj.matrix_world @ pelvis_bone.head
     
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
     return np.array([pelvis_world_pos.x, pelvis_world_pos.y, pelvis_world_pos.z])
 
 
@@ -28,14 +28,9 @@ import sys
 from pathlib import Path
 from mathutils import Vector
 
-
-# SMPL+H Joint Names
-JOINT_NAMES = [
-    "Pelvis", "L_Hip", "R_Hip", "Spine1", "L_Knee", "R_Knee", "Spine2", 
-    "L_Ankle", "R_Ankle", "Spine3", "L_Foot", "R_Foot", "Neck", 
-    "L_Collar", "R_Collar", "Head", "L_Shoulder", "R_Shoulder", 
-    "L_Elbow", "R_Elbow", "L_Wrist", "R_Wrist"
-] + [f"L_Hand_{i}" for i in range(15)] + [f"R_Hand_{i}" for i in range(15)]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from smpl_constants import JOINT_NAMES, REFERENCE_NPZ_PATH
+from blender_debug import import_glb_and_get_armature
 
 
 def extract_frame_joint_positions(glb_path: Path, frame_number: int = 0) -> np.ndarray:
@@ -45,64 +40,24 @@ def extract_frame_joint_positions(glb_path: Path, frame_number: int = 0) -> np.n
     Returns:
         (52, 3) array of joint positions in world space
     """
-    # Clear scene
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    for action in bpy.data.actions:
-        bpy.data.actions.remove(action)
-    for mesh in bpy.data.meshes:
-        bpy.data.meshes.remove(mesh)
-    for armature in bpy.data.armatures:
-        bpy.data.armatures.remove(armature)
-    
-    # Import GLB
-    bpy.ops.import_scene.gltf(filepath=str(glb_path))
-    
-    # Find armature
-    armature_obj = next((obj for obj in bpy.context.scene.objects if obj.type == 'ARMATURE'), None)
-    if not armature_obj:
-        raise RuntimeError(f"No armature found in {glb_path}")
+    _, pose_bones, _ = import_glb_and_get_armature(glb_path)
     
     # Set to desired frame
     bpy.context.scene.frame_set(frame_number)
     
     # Extract joint positions
-    bpy.context.view_layer.objects.active = armature_obj
-    bpy.ops.object.mode_set(mode='POSE')
-    
-    pose_bones = armature_obj.pose.bones
     joint_positions = np.zeros((len(JOINT_NAMES), 3))
-    
-    for i, joint_name in enumerate(JOINT_NAMES):
-        pose_bone = pose_bones.get(joint_name)
+    for i, pose_bone in enumerate(pose_bones):
         if pose_bone:
-            bone = pose_bone.bone
-            
-            # At frame 0 with identity rotations and zero locations, 
-            # the bone should be at rest pose, so bone.head is correct
-            # But we still need to apply any pose transform
-            # The simplest: use bone.head in rest pose, which should match
-            # the reference since armature was created from reference
-            
-            # Actually, let's compute the pose-space position properly:
-            # pose_bone.matrix is the full transform (includes parents)
-            # But for validation, we want just the local transform
-            
-            # Get pose-space head position in armature local space
-            # pose_bone.matrix includes full parent chain transform
-            # bone.head is rest pose position in bone's local space
-            # pose_bone.matrix @ bone.head gives final position in armature local space
-            pose_head = pose_bone.matrix @ bone.head
-            joint_positions[i] = np.array([pose_head.x, pose_head.y, pose_head.z])
-    
-    bpy.ops.object.mode_set(mode='OBJECT')
+            # pose_bone.head is the posed head position in armature local space
+            # (it already includes the full parent chain, no matrix product needed)
+            joint_positions[i] = pose_bone.head
     return joint_positions
 
 
 def load_reference_positions() -> np.ndarray:
     """Load reference A-pose joint positions from NPZ."""
-    ref_path = Path(__file__).parent.parent.parent / 'data' / 'reference' / 'smplh_target_reference.npz'
-    ref = np.load(str(ref_path))
+    ref = np.load(str(REFERENCE_NPZ_PATH))
     return ref['J_ABSOLUTE']
 
 
@@ -30,6 +30,8 @@ import sys
 from pathlib import Path
 from typing import Dict, Any
 
+from npz_io import load_npz_mmap
+
 
 # SMPL-H joint names for reference
 JOINT_NAMES = [
@@ -164,7 +166,8 @@ def visualize_reference_npz(npz_path: Path, output_path: Path) -> None:
 
 def visualize_animation_npz(npz_path: Path, output_path: Path) -> None:
     """Visualize animation NPZ file (AMASS data)."""
-    data = np.load(str(npz_path))
+    # Memory-mapped: only frame 0 of poses and the first rows of trans are read
+    data = load_npz_mmap(npz_path)
     
     lines = []
     lines.append("="*80)
@@ -59,29 +59,22 @@ print(f"\n🔍 Comparing Bone Lengths (SMPL_OFFSETS):")
 print(f"   {'Joint':<20} {'T-pose Offset':<30} {'A-pose Offset':<30} {'Difference':<20} {'Match'}")
 print("   " + "-"*110)
 
-max_diff = 0.0
-max_diff_joint = None
-all_match = True
+# Per-joint offset differences in one vectorized pass
+offset_diffs = np.linalg.norm(T_POSE_SMPL_OFFSETS - A_POSE_SMPL_OFFSETS, axis=1)
 
-for i in range(52):
+# Check if they match (within 1mm tolerance)
+offset_matches = offset_diffs < 0.001
+all_match = bool(offset_matches.all())
+
+max_diff_idx = int(offset_diffs.argmax())
+max_diff = offset_diffs[max_diff_idx]
+max_diff_joint = JOINT_NAMES[max_diff_idx] if max_diff_idx < len(JOINT_NAMES) else f"Joint_{max_diff_idx}"
+
+# Only print joints with differences or first 10 joints
+for i in np.flatnonzero(~offset_matches | (np.arange(52) < 10)):
     joint_name = JOINT_NAMES[i] if i < len(JOINT_NAMES) else f"Joint_{i}"
-    t_offset = T_POSE_SMPL_OFFSETS[i]
-    a_offset = A_POSE_SMPL_OFFSETS[i]
-    diff = np.linalg.norm(t_offset - a_offset)
-    
-    # Check if they match (within 1mm tolerance)
-    matches = diff < 0.001
-    if not matches:
-        all_match = False
-    
-    if diff > max_diff:
-        max_diff = diff
-        max_diff_joint = joint_name
-    
-    # Only print joints with differences or first 10 joints
-    if not matches or i < 10:
-        match_str = "✓" if matches else "✗"
-        print(f"   {joint_name:<20} {str(t_offset):<30} {str(a_offset):<30} {diff:<20.6f} {match_str}")
+    match_str = "✓" if offset_matches[i] else "✗"
+    print(f"   {joint_name:<20} {str(T_POSE_SMPL_OFFSETS[i]):<30} {str(A_POSE_SMPL_OFFSETS[i]):<30} {offset_diffs[i]:<20.6f} {match_str}")
 
 print(f"\n📊 Summary:")
 print(f"   Maximum difference: {max_diff:.6f} meters ({max_diff*1000:.3f} mm)")
@@ -11,6 +11,17 @@ from pathlib import Path
 from mathutils import Quaternion, Euler, Vector
 
 
+def get_bone_heads_world(armature, bone_names, frame_idx: int) -> np.ndarray:
+    """Set the frame once and return (N, 3) world-space head positions for bone_names"""
+    bpy.context.scene.frame_set(frame_idx)
+    pose_bones = armature.pose.bones
+    local_heads = np.array([pose_bones[name].head for name in bone_names])
+    
+    # Apply the armature's world matrix to all heads in one matmul
+    matrix_world = np.array(armature.matrix_world)
+    return local_heads @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+
+
 def diagnose_glb(glb_path: Path):
     """Diagnose frame 0 appearance"""
     print(f"\n{'='*80}")
@@ -36,35 +47,31 @@ def diagnose_glb(glb_path: Path):
         return
     
     # Check frame 0
-    bpy.context.scene.frame_set(0)
+    head_bones = ["Pelvis", "L_Shoulder", "R_Shoulder", "L_Hip", "R_Hip", "Spine1"]
+    head_bones = [name for name in head_bones if name in armature.pose.bones]
+    arm_bones = ["L_Shoulder", "L_Elbow", "R_Shoulder", "R_Elbow"]
     
     # Get world-space bone positions (what you actually see)
+    frame0_heads = get_bone_heads_world(armature, head_bones + arm_bones, 0)
     print("\nFrame 0 - Bone HEAD positions (world space - what you see):")
     
-    for bone_name in ["Pelvis", "L_Shoulder", "R_Shoulder", "L_Hip", "R_Hip", "Spine1"]:
-        if bone_name in armature.pose.bones:
-            pose_bone = armature.pose.bones[bone_name]
-            # World position
-            world_pos = armature.matrix_world @ pose_bone.head
-            print(f"  {bone_name}: [{world_pos.x:.4f}, {world_pos.y:.4f}, {world_pos.z:.4f}]")
+    for bone_name, world_pos in zip(head_bones, frame0_heads):
+        print(f"  {bone_name}: [{world_pos[0]:.4f}, {world_pos[1]:.4f}, {world_pos[2]:.4f}]")
     
     # Get ELBOW positions to check if arms are down (A-pose) or out (T-pose/mocap)
     # Shoulder rotation affects where the elbow is, not where the shoulder head is
-    l_elbow_pos = armature.matrix_world @ armature.pose.bones["L_Elbow"].head
-    r_elbow_pos = armature.matrix_world @ armature.pose.bones["R_Elbow"].head
-    l_shoulder_pos = armature.matrix_world @ armature.pose.bones["L_Shoulder"].head
-    r_shoulder_pos = armature.matrix_world @ armature.pose.bones["R_Shoulder"].head
+    l_shoulder_pos, l_elbow_pos, r_shoulder_pos, r_elbow_pos = frame0_heads[len(head_bones):]
     
     print(f"\nArm position analysis (checking if arms are down = A-pose):")
-    print(f"  L_Shoulder head: [{l_shoulder_pos.x:.4f}, {l_shoulder_pos.y:.4f}, {l_shoulder_pos.z:.4f}]")
-    print(f"  L_Elbow head:    [{l_elbow_pos.x:.4f}, {l_elbow_pos.y:.4f}, {l_elbow_pos.z:.4f}]")
-    print(f"  R_Shoulder head: [{r_shoulder_pos.x:.4f}, {r_shoulder_pos.y:.4f}, {r_shoulder_pos.z:.4f}]")
-    print(f"  R_Elbow head:    [{r_elbow_pos.x:.4f}, {r_elbow_pos.y:.4f}, {r_elbow_pos.z:.4f}]")
+    print(f"  L_Shoulder head: [{l_shoulder_pos[0]:.4f}, {l_shoulder_pos[1]:.4f}, {l_shoulder_pos[2]:.4f}]")
+    print(f"  L_Elbow head:    [{l_elbow_pos[0]:.4f}, {l_elbow_pos[1]:.4f}, {l_elbow_pos[2]:.4f}]")
+    print(f"  R_Shoulder head: [{r_shoulder_pos[0]:.4f}, {r_shoulder_pos[1]:.4f}, {r_shoulder_pos[2]:.4f}]")
+    print(f"  R_Elbow head:    [{r_elbow_pos[0]:.4f}, {r_elbow_pos[1]:.4f}, {r_elbow_pos[2]:.4f}]")
     
     # In T-pose: elbows are roughly same Z as shoulders (arms horizontal)
     # In A-pose: elbows are LOWER Z than shoulders (arms angled down)
-    l_arm_z_diff = l_shoulder_pos.z - l_elbow_pos.z
-    r_arm_z_diff = r_shoulder_pos.z - r_elbow_pos.z
+    l_arm_z_diff = l_shoulder_pos[2] - l_elbow_pos[2]
+    r_arm_z_diff = r_shoulder_pos[2] - r_elbow_pos[2]
     
     print(f"\n  L_arm Z difference (shoulder - elbow): {l_arm_z_diff:.4f}")
     print(f"  R_arm Z difference (shoulder - elbow): {r_arm_z_diff:.4f}")
@@ -99,15 +106,10 @@ def diagnose_glb(glb_path: Path):
     print("Frame 1 for comparison (mocap animation):")
     print('='*40)
     
-    bpy.context.scene.frame_set(1)
-    
-    l_elbow_pos_f1 = armature.matrix_world @ armature.pose.bones["L_Elbow"].head
-    r_elbow_pos_f1 = armature.matrix_world @ armature.pose.bones["R_Elbow"].head
-    l_shoulder_pos_f1 = armature.matrix_world @ armature.pose.bones["L_Shoulder"].head
-    r_shoulder_pos_f1 = armature.matrix_world @ armature.pose.bones["R_Shoulder"].head
+    l_shoulder_pos_f1, l_elbow_pos_f1, r_shoulder_pos_f1, r_elbow_pos_f1 = get_bone_heads_world(armature, arm_bones, 1)
     
-    l_arm_z_diff_f1 = l_shoulder_pos_f1.z - l_elbow_pos_f1.z
-    r_arm_z_diff_f1 = r_shoulder_pos_f1.z - r_elbow_pos_f1.z
+    l_arm_z_diff_f1 = l_shoulder_pos_f1[2] - l_elbow_pos_f1[2]
+    r_arm_z_diff_f1 = r_shoulder_pos_f1[2] - r_elbow_pos_f1[2]
     
     print(f"  L_arm Z difference: {l_arm_z_diff_f1:.4f}")
     print(f"  R_arm Z difference: {r_arm_z_diff_f1:.4f}")
@@ -84,36 +84,23 @@ print("   " + "-"*110)
 
 from retarget import JOINT_NAMES
 
-all_match = True
-max_diff = 0.0
-max_diff_joint = None
-
-for i in range(52):
+# Root (Pelvis) compares magnitudes (position can differ); other bones compare offset vectors directly
+t_lengths = np.sqrt((T_POSE_SMPL_OFFSETS ** 2).sum(axis=1))
+a_lengths = np.sqrt((A_POSE_SMPL_OFFSETS ** 2).sum(axis=1))
+offset_diffs = np.sqrt(((T_POSE_SMPL_OFFSETS - A_POSE_SMPL_OFFSETS) ** 2).sum(axis=1))
+offset_diffs[0] = abs(t_lengths[0] - a_lengths[0])
+offset_matches = offset_diffs < 1e-6
+all_match = bool(offset_matches.all())
+
+max_diff_idx = int(offset_diffs.argmax())
+max_diff = offset_diffs[max_diff_idx]
+max_diff_joint = JOINT_NAMES[max_diff_idx] if max_diff_idx < len(JOINT_NAMES) else f"Joint_{max_diff_idx}"
+
+# Print first 10 and any mismatches
+for i in np.flatnonzero(~offset_matches | (np.arange(52) < 10)):
     joint_name = JOINT_NAMES[i] if i < len(JOINT_NAMES) else f"Joint_{i}"
-    t_offset = T_POSE_SMPL_OFFSETS[i]
-    a_offset = A_POSE_SMPL_OFFSETS[i]
-    
-    # For root (Pelvis), compare magnitudes (position can differ)
-    if i == 0:
-        t_mag = np.linalg.norm(t_offset)
-        a_mag = np.linalg.norm(a_offset)
-        diff = abs(t_mag - a_mag)
-        matches = diff < 1e-6
-    else:
-        # For non-root bones, compare the offset vectors directly
-        diff = np.linalg.norm(t_offset - a_offset)
-        matches = diff < 1e-6
-    
-    if not matches:
-        all_match = False
-        if diff > max_diff:
-            max_diff = diff
-            max_diff_joint = joint_name
-    
-    # Print first 10 and any mismatches
-    if i < 10 or not matches:
-        match_str = "✓" if matches else "✗"
-        print(f"   {joint_name:<20} {str(t_offset):<40} {str(a_offset):<40} {match_str} {diff:.6e}")
+    match_str = "✓" if offset_matches[i] else "✗"
+    print(f"   {joint_name:<20} {str(T_POSE_SMPL_OFFSETS[i]):<40} {str(A_POSE_SMPL_OFFSETS[i]):<40} {match_str} {offset_diffs[i]:.6e}")
 
 print(f"\n📊 Summary:")
 print(f"   All bone lengths match: {'✅ YES' if all_match else '❌ NO'}")
@@ -131,14 +118,10 @@ print(f"\n🔍 Bone Length Magnitudes (should match for non-root bones):")
 print(f"   {'Joint':<20} {'T-pose Length':<20} {'A-pose Length':<20} {'Difference':<20}")
 print("   " + "-"*80)
 
-for i in range(52):
+length_diffs = np.abs(t_lengths - a_lengths)
+for i in np.flatnonzero((length_diffs > 1e-6) | (np.arange(52) < 10)):
     joint_name = JOINT_NAMES[i] if i < len(JOINT_NAMES) else f"Joint_{i}"
-    t_len = np.linalg.norm(T_POSE_SMPL_OFFSETS[i])
-    a_len = np.linalg.norm(A_POSE_SMPL_OFFSETS[i])
-    diff = abs(t_len - a_len)
-    
-    if i < 10 or diff > 1e-6:
-        print(f"   {joint_name:<20} {t_len:<20.6f} {a_len:<20.6f} {diff:<20.6e}")
+    print(f"   {joint_name:<20} {t_lengths[i]:<20.6f} {a_lengths[i]:<20.6f} {length_diffs[i]:<20.6e}")
 
 print("\n" + "="*80)
 
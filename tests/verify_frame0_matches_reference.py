@@ -54,34 +54,26 @@ print("\nComparing frame 0 positions to reference A-pose:")
 print(f"{'Joint':<20} {'Match?':<8} {'Distance (m)':<15}")
 print("-" * 50)
 
-total_distance = 0.0
-max_distance = 0.0
-max_distance_joint = ""
-
-for i, joint_name in enumerate(JOINT_NAMES[:10]):  # Check first 10 joints
-    if joint_name not in armature.pose.bones:
-        continue
-    
-    pose_bone = armature.pose.bones[joint_name]
-    world_pos = armature.matrix_world @ pose_bone.head
-    
-    # Reference position
-    ref_pos = reference_j_absolute[i]
-    
-    # Compute distance
-    diff = np.array([world_pos.x - ref_pos[0], 
-                     world_pos.y - ref_pos[1],
-                     world_pos.z - ref_pos[2]])
-    distance = np.sqrt(np.sum(diff**2))
-    
-    total_distance += distance
-    if distance > max_distance:
-        max_distance = distance
-        max_distance_joint = joint_name
-    
+# Collect the first 10 joints' posed heads, then compare them all at once
+pose_bones = armature.pose.bones
+indices_present = [i for i, joint_name in enumerate(JOINT_NAMES[:10]) if joint_name in pose_bones]
+names_present = [JOINT_NAMES[i] for i in indices_present]
+local_heads = np.array([pose_bones[name].head for name in names_present], dtype=np.float64).reshape(-1, 3)
+
+# Armature space -> world space in one matmul
+M = np.array(armature.matrix_world)
+world_heads = local_heads @ M[:3, :3].T + M[:3, 3]
+
+distances = np.sqrt(((world_heads - reference_j_absolute[indices_present]) ** 2).sum(axis=1))
+
+for joint_name, distance in zip(names_present, distances):
     match = "✓" if distance < 0.01 else "✗"
     print(f"{joint_name:<20} {match:<8} {distance:<15.6f}")
 
+total_distance = float(distances.sum())
+max_distance = float(distances.max()) if len(distances) else 0.0
+max_distance_joint = names_present[int(distances.argmax())] if len(distances) else ""
+
 avg_distance = total_distance / 10
 print("-" * 50)
 print(f"Average distance: {avg_distance:.6f} m")